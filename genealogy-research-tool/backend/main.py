@@ -1,27 +1,35 @@
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
 from pydantic import BaseModel
 from typing import List, Dict, Optional
+import orjson
 import os
+import time
 from dotenv import load_dotenv
 
 # Load environment
 load_dotenv()
 
-from models import get_db, ObituaryCache, ExtractedFact, PersonCluster, GrampsCitation
+from models import get_db, ObituaryCache, LLMCache, ExtractedFact, PersonCluster, GrampsCitation
 from services.llm_extractor import process_obituary_full
 from services.fact_clusterer import FactClusterer
-from services.gramps_client import GrampsClient
+from services.gramps_client import GrampsClient, get_gramps_client
 from services.gramps_matcher import GrampsMatcher
 from services.gramps_citation_service import CitationService
 from utils.hash_utils import hash_url
 import json
 
+# Responses are encoded with orjson, which is much faster than the json
+# module on the large fact and cluster listings
 app = FastAPI(
     title="Genealogy Research Tool API",
     version="1.0.0",
-    description="Extract genealogical facts from obituaries using LLM technology"
+    description="Extract genealogical facts from obituaries using LLM technology",
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -39,23 +47,25 @@ app.add_middleware(
 # ============================================================================
 
 @app.delete("/api/admin/reset-database")
-async def reset_database(db: Session = Depends(get_db)):
+def reset_database(db: Session = Depends(get_db)):
     """Complete database reset - clears all data"""
     from models import LLMCache
 
+    # DELETE reports the rows it removed, so no separate COUNT(*) scans
+    llm_cache_count = db.query(LLMCache).delete()
+    facts_count = db.query(ExtractedFact).delete()
+    clusters_count = db.query(PersonCluster).delete()
+    obituaries_count = db.query(ObituaryCache).delete()
+    db.commit()
+    _invalidate_gramps_matches()
+
     counts = {
-        'obituaries': db.query(ObituaryCache).count(),
-        'llm_cache': db.query(LLMCache).count(),
-        'facts': db.query(ExtractedFact).count(),
-        'clusters': db.query(PersonCluster).count()
+        'obituaries': obituaries_count,
+        'llm_cache': llm_cache_count,
+        'facts': facts_count,
+        'clusters': clusters_count
     }
 
-    db.query(LLMCache).delete()
-    db.query(ExtractedFact).delete()
-    db.query(PersonCluster).delete()
-    db.query(ObituaryCache).delete()
-    db.commit()
-
     return {'status': 'success', 'deleted': counts}
 
 
@@ -121,29 +131,39 @@ class ObituaryFactsResponse(BaseModel):
 # ENDPOINTS
 # ============================================================================
 
+# Endpoints that block on the database or Gramps are plain functions, which
+# FastAPI runs in its threadpool; as async functions they would hold the
+# event loop and serialize every request. Only obituary processing is
+# async, as it awaits the LLM
+
+# Fixed health and info responses, serialized once at import
+HEALTH_RESPONSE_BODY = orjson.dumps({"status": "healthy", "service": "genealogy-research-tool"})
+ROOT_RESPONSE_BODY = orjson.dumps({
+    "service": "Genealogy Research Tool API",
+    "version": "2.0.0",
+    "phase": "Phase 2 - Cross-Obituary Clustering",
+    "endpoints": {
+        "/health": "Health check",
+        "/api/obituaries/process": "Process an obituary (POST)",
+        "/api/obituaries/{id}/facts": "Get facts for an obituary (GET)",
+        "/api/clusters/generate": "Generate person clusters (POST)",
+        "/api/clusters": "List all clusters (GET)",
+        "/api/clusters/{id}": "Get cluster details (GET)",
+        "/api/clusters/{id}/corroboration": "Get corroboration info (GET)"
+    }
+})
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "service": "genealogy-research-tool"}
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
 @app.get("/")
 async def root():
     """Root endpoint with API info"""
-    return {
-        "service": "Genealogy Research Tool API",
-        "version": "2.0.0",
-        "phase": "Phase 2 - Cross-Obituary Clustering",
-        "endpoints": {
-            "/health": "Health check",
-            "/api/obituaries/process": "Process an obituary (POST)",
-            "/api/obituaries/{id}/facts": "Get facts for an obituary (GET)",
-            "/api/clusters/generate": "Generate person clusters (POST)",
-            "/api/clusters": "List all clusters (GET)",
-            "/api/clusters/{id}": "Get cluster details (GET)",
-            "/api/clusters/{id}/corroboration": "Get corroboration info (GET)"
-        }
-    }
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 
 @app.post("/api/obituaries/process", response_model=ProcessObituaryResponse)
@@ -178,16 +198,36 @@ async def process_obituary(
             processing_status='processing'
         )
         db.add(obituary)
+        try:
+            db.flush()  # Assigns the ID
+            print(f"Processing new obituary: {request.source_url}")
+        except IntegrityError:
+            # A concurrent request stored this URL after the lookup above;
+            # the insert was this transaction's only write, so roll it
+            # back and use that row as a cache hit
+            db.rollback()
+            obituary = db.query(ObituaryCache).filter(
+                ObituaryCache.url_hash == url_hash_value
+            ).one()
+            cache_hit = True
+            print(f"Cache hit for {request.source_url}")
+
+    # Read what extraction needs before committing: commits expire the
+    # obituary, and reading it afterwards costs a refresh SELECT each time
+    obituary_id = obituary.id
+    obituary_text = obituary.extracted_text
+    if not cache_hit:
         db.commit()
-        db.refresh(obituary)
-        print(f"Processing new obituary: {request.source_url}")
 
     # Extract facts
     try:
+        # Extraction only flushes its rows; they are committed together
+        # with the status update below, in one transaction
         result = await process_obituary_full(
             db,
-            obituary.id,
-            obituary.extracted_text
+            obituary_id,
+            obituary_text,
+            commit=False
         )
 
         # Update status
@@ -195,7 +235,7 @@ async def process_obituary(
         db.commit()
 
         return ProcessObituaryResponse(
-            obituary_id=obituary.id,
+            obituary_id=obituary_id,
             persons_extracted=result['persons_extracted'],
             facts_extracted=result['facts_extracted'],
             cache_hit=cache_hit,
@@ -204,46 +244,77 @@ async def process_obituary(
         )
 
     except Exception as e:
+        # Roll back the partial extraction so only the failed status is
+        # stored. LLM calls made on the way are kept: a response is a valid
+        # cache entry for a retry, and an error row records the failure.
+        # They are read before the rollback and the ones it undid re-added
+        llm_calls = db.query(*LLMCache.__table__.columns).filter(
+            LLMCache.obituary_cache_id == obituary_id
+        ).all()
+        db.rollback()
+        kept_ids = {
+            call_id for call_id, in db.query(LLMCache.id).filter(
+                LLMCache.obituary_cache_id == obituary_id
+            )
+        }
+        undone_calls = [
+            {key: value for key, value in call._mapping.items() if key != 'id'}
+            for call in llm_calls
+            if call.id not in kept_ids
+        ]
+        if undone_calls:
+            db.bulk_insert_mappings(LLMCache, undone_calls)
+
+        obituary = db.get(ObituaryCache, obituary_id)
         obituary.processing_status = 'failed'
         db.commit()
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/obituaries/{obituary_id}/facts", response_model=ObituaryFactsResponse)
-async def get_obituary_facts(
+def get_obituary_facts(
     obituary_id: int,
     db: Session = Depends(get_db)
 ):
     """Get all facts for a specific obituary"""
 
-    # Check obituary exists
-    obituary = db.query(ObituaryCache).filter(
+    # Check obituary exists (by ID only, without loading its HTML and text)
+    obituary = db.query(ObituaryCache.id).filter(
         ObituaryCache.id == obituary_id
     ).first()
 
     if not obituary:
         raise HTTPException(status_code=404, detail=f"Obituary {obituary_id} not found")
 
-    facts = db.query(ExtractedFact).filter(
+    # Read-only listing: select the API columns directly instead of
+    # building an ORM object per fact
+    facts = db.query(*ExtractedFact.dict_columns()).filter(
         ExtractedFact.obituary_cache_id == obituary_id
     ).all()
 
     return ObituaryFactsResponse(
         obituary_id=obituary_id,
         fact_count=len(facts),
-        facts=[fact.to_dict() for fact in facts]
+        facts=[ExtractedFact.row_to_dict(fact) for fact in facts]
     )
 
 
 @app.get("/api/obituaries")
-async def list_obituaries(
+def list_obituaries(
     db: Session = Depends(get_db),
     limit: int = 10,
     offset: int = 0
 ):
     """List all processed obituaries"""
 
-    obituaries = db.query(ObituaryCache).offset(offset).limit(limit).all()
+    # Only the listed columns; each row's raw HTML and extracted text
+    # would otherwise be loaded for nothing
+    obituaries = db.query(
+        ObituaryCache.id,
+        ObituaryCache.url,
+        ObituaryCache.processing_status,
+        ObituaryCache.fetch_timestamp
+    ).offset(offset).limit(limit).all()
 
     return {
         "count": len(obituaries),
@@ -260,98 +331,173 @@ async def list_obituaries(
 
 
 @app.get("/api/facts/by-person/{person_name}")
-async def get_facts_by_person(
+def get_facts_by_person(
     person_name: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    limit: int = 50,
+    offset: int = 0
 ):
-    """Get all facts about a specific person across all obituaries"""
+    """
+    Get facts about a specific person across all obituaries.
 
-    facts = db.query(ExtractedFact).filter(
-        ExtractedFact.subject_name.ilike(f"%{person_name}%")
-    ).all()
+    Paged by fact id: returns at most `limit` facts starting at `offset`,
+    with `total` giving the number of matching facts across all pages.
+    """
+
+    # subject_name uses a case-insensitive collation, so LIKE already matches
+    # regardless of case; ILIKE compiles to lower(subject_name) LIKE lower(...)
+    # which runs lower() on every row and hides the column from the optimizer
+    name_filter = ExtractedFact.subject_name.like(f"%{person_name}%")
+    total = db.query(func.count(ExtractedFact.id)).filter(name_filter).scalar()
+    facts = db.query(*ExtractedFact.dict_columns()).filter(
+        name_filter
+    ).order_by(ExtractedFact.id).offset(offset).limit(limit).all()
 
     return {
         "person_name": person_name,
+        "total": total,
         "fact_count": len(facts),
-        "facts": [fact.to_dict() for fact in facts]
+        "facts": [ExtractedFact.row_to_dict(fact) for fact in facts]
     }
 
+# Cross-obituary results are reused while the facts and completed
+# obituaries they are computed from look unchanged (same max fact id and
+# counts), for at most this many seconds. The cache is one immutable
+# (token, computed_at, result) tuple replaced in a single assignment, so
+# concurrent requests never see a partially updated entry
+CROSS_OBITUARY_CACHE_TTL = 30
+_cross_obituary_cache = (None, 0.0, None)
+
+
 @app.get("/api/analysis/cross-obituary")
-async def cross_obituary_analysis(db: Session = Depends(get_db)):
+def cross_obituary_analysis(db: Session = Depends(get_db)):
     """
     Analyze facts across multiple obituaries to identify:
     - People mentioned in multiple obituaries
     - Potential name variants needing fuzzy matching
     """
-    from sqlalchemy import func, distinct
+    global _cross_obituary_cache
+    from sqlalchemy import func, distinct, select
     from collections import defaultdict
 
-    # Find people in multiple obituaries
+    # One small query tells whether the data changed since the cached
+    # result; its counts double as the response totals
+    max_fact_id, total_facts, total_obituaries = db.query(
+        db.query(func.max(ExtractedFact.id)).scalar_subquery(),
+        db.query(func.count(ExtractedFact.id)).scalar_subquery(),
+        db.query(func.count(ObituaryCache.id)).filter(
+            ObituaryCache.processing_status == 'completed'
+        ).scalar_subquery()
+    ).one()
+    token = (max_fact_id, total_facts, total_obituaries)
+
+    cached_token, computed_at, cached_result = _cross_obituary_cache
+    if (cached_token == token
+            and time.monotonic() - computed_at < CROSS_OBITUARY_CACHE_TTL):
+        return cached_result
+
+    # Find people in multiple obituaries together with their obituary
+    # URLs: the per-name aggregate is a subquery joined back to the facts
+    # and obituaries, so the counts and URLs arrive in one round trip
+    obit_count = func.count(distinct(ExtractedFact.obituary_cache_id))
     multi_obit_people = db.query(
         ExtractedFact.subject_name,
-        func.count(distinct(ExtractedFact.obituary_cache_id)).label('obit_count')
+        obit_count.label('obit_count')
     ).group_by(
         ExtractedFact.subject_name
     ).having(
-        func.count(distinct(ExtractedFact.obituary_cache_id)) > 1
-    ).order_by(
-        func.count(distinct(ExtractedFact.obituary_cache_id)).desc()
-    ).all()
-
-    people_in_multiple_obits = []
-    for name, count in multi_obit_people:
-        facts = db.query(ExtractedFact).filter(
-            ExtractedFact.subject_name == name
-        ).all()
-
-        obit_ids = list(set(f.obituary_cache_id for f in facts))
-        obits = db.query(ObituaryCache).filter(
-            ObituaryCache.id.in_(obit_ids)
-        ).all()
-
-        people_in_multiple_obits.append({
-            'name': name,
-            'obituary_count': count,
-            'obituaries': [o.url for o in obits]
-        })
+        obit_count > 1
+    ).subquery()
+
+    # subject_name compares case-insensitively, so the join picks up every
+    # casing of each aggregated name
+    people_obits = db.query(
+        multi_obit_people.c.subject_name,
+        multi_obit_people.c.obit_count,
+        ObituaryCache.id,
+        ObituaryCache.url
+    ).join(
+        ExtractedFact, ExtractedFact.subject_name == multi_obit_people.c.subject_name
+    ).join(
+        ObituaryCache, ObituaryCache.id == ExtractedFact.obituary_cache_id
+    ).distinct().order_by(
+        multi_obit_people.c.obit_count.desc(),
+        multi_obit_people.c.subject_name,
+        ObituaryCache.id
+    )
 
-    # Detect potential name variants
-    all_names = db.query(distinct(ExtractedFact.subject_name)).all()
-    all_names = [n[0] for n in all_names]
+    # Obituary URLs are kept as dict keys so de-duplicating is a hash
+    # lookup rather than a list scan, while preserving first-seen order
+    people_by_name = {}
+    for name, count, _, url in people_obits.yield_per(1000):
+        person = people_by_name.get(name)
+        if person is None:
+            person = people_by_name[name] = {
+                'name': name,
+                'obituary_count': count,
+                'obituaries': {}
+            }
+        person['obituaries'].setdefault(url)
+
+    people_in_multiple_obits = [
+        {**person, 'obituaries': list(person['obituaries'])}
+        for person in people_by_name.values()
+    ]
+
+    # Detect potential name variants. Names are streamed in batches and
+    # grouped as they arrive rather than materialized as a list first
+    names_query = select(distinct(ExtractedFact.subject_name))
+    if db.get_bind().dialect.name == 'mysql':
+        # Only a name whose last word another name shares can be in a
+        # variant group, so MariaDB narrows the names down to those and
+        # the rest never leave the database. Exact grouping stays below
+        other_fact = aliased(ExtractedFact)
+        other_surname = func.substring_index(other_fact.subject_name, ' ', -1)
+        shared_surnames = select(other_surname).where(
+            other_fact.subject_name.like('% %')
+        ).group_by(other_surname).having(
+            func.count(distinct(other_fact.subject_name)) > 1
+        )
+        names_query = names_query.where(
+            func.substring_index(ExtractedFact.subject_name, ' ', -1).in_(shared_surnames)
+        )
+    all_names = db.scalars(names_query.execution_options(yield_per=1000))
 
+    # Single pass: group names by surname and track the distinct given
+    # names alongside, so names don't need to be split a second time
     surname_groups = defaultdict(list)
+    surname_firsts = defaultdict(set)
     for name in all_names:
         parts = name.split()
         if len(parts) >= 2:
             surname = parts[-1]
             surname_groups[surname].append(name)
+            surname_firsts[surname].add(' '.join(parts[:-1]))
 
     potential_variants = []
     for surname, names in surname_groups.items():
-        if len(names) > 1:
-            first_names = [' '.join(n.split()[:-1]) for n in names]
-            unique_firsts = set(first_names)
-            if len(unique_firsts) > 1:
-                potential_variants.append({
-                    'surname': surname,
-                    'variants': names
-                })
+        if len(names) > 1 and len(surname_firsts[surname]) > 1:
+            potential_variants.append({
+                'surname': surname,
+                'variants': names
+            })
 
-    return {
+    result = {
         'people_in_multiple_obituaries': people_in_multiple_obits,
         'potential_name_variants': potential_variants,
-        'total_obituaries_processed': db.query(ObituaryCache).filter(
-            ObituaryCache.processing_status == 'completed'
-        ).count(),
-        'total_facts': db.query(ExtractedFact).count()
+        'total_obituaries_processed': total_obituaries,
+        'total_facts': total_facts
     }
+    _cross_obituary_cache = (token, time.monotonic(), result)
+
+    return result
 
 # ============================================================================
 # CLUSTERING ENDPOINTS (Phase 2)
 # ============================================================================
 
 @app.post("/api/clusters/generate")
-async def generate_clusters(db: Session = Depends(get_db)):
+def generate_clusters(db: Session = Depends(get_db)):
     """
     Generate person clusters across all obituaries.
 
@@ -365,6 +511,16 @@ async def generate_clusters(db: Session = Depends(get_db)):
 
     # Create database records
     cluster_records = clusterer.create_person_cluster_records(clusters)
+    # Cluster IDs are reassigned, so cached matches no longer apply
+    _invalidate_gramps_matches()
+
+    # Committing expired the records; reload the ones shown below in one
+    # query rather than one refresh SELECT per record
+    shown_records = cluster_records[:20]  # First 20 clusters
+    if shown_records:
+        db.query(PersonCluster).filter(
+            PersonCluster.id.in_([inspect(rec).identity[0] for rec in shown_records])
+        ).all()
 
     return {
         'clusters_created': len(cluster_records),
@@ -383,30 +539,53 @@ async def generate_clusters(db: Session = Depends(get_db)):
                 'fact_count': rec.fact_count,
                 'confidence': float(rec.confidence_score) if rec.confidence_score else None
             }
-            for rec in cluster_records[:20]  # First 20 clusters
+            for rec in shown_records
         ]
     }
 
 
 @app.get("/api/clusters")
-async def list_clusters(
+def list_clusters(
     min_sources: int = 1,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    limit: int = 50,
+    offset: int = 0
 ):
     """
-    List all person clusters, optionally filtered by minimum source count.
+    List person clusters, optionally filtered by minimum source count.
+
+    Paged: returns at most `limit` clusters starting at `offset`, ordered
+    by source and fact count, with `total` giving the number of matching
+    clusters across all pages.
     """
-    query = db.query(PersonCluster)
+    # Select plain column tuples rather than PersonCluster objects; the
+    # list can cover every cluster, and building and tracking an ORM
+    # instance per row costs more than the response itself
+    query = db.query(
+        PersonCluster.id,
+        PersonCluster.canonical_name,
+        PersonCluster.name_variants,
+        PersonCluster.source_count,
+        PersonCluster.fact_count,
+        PersonCluster.confidence_score,
+        PersonCluster.cluster_status,
+        PersonCluster.gramps_person_id
+    )
 
     if min_sources > 1:
         query = query.filter(PersonCluster.source_count >= min_sources)
 
+    total = query.with_entities(func.count(PersonCluster.id)).scalar()
+
+    # id breaks ties so pages don't overlap or skip clusters
     clusters = query.order_by(
         PersonCluster.source_count.desc(),
-        PersonCluster.fact_count.desc()
-    ).all()
+        PersonCluster.fact_count.desc(),
+        PersonCluster.id
+    ).offset(offset).limit(limit).all()
 
     return {
+        'total': total,
         'cluster_count': len(clusters),
         'clusters': [
             {
@@ -425,30 +604,35 @@ async def list_clusters(
 
 
 @app.get("/api/clusters/{cluster_id}")
-async def get_cluster_details(
+def get_cluster_details(
     cluster_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    include_facts: bool = True
 ):
     """
     Get detailed information about a specific person cluster,
     including all facts and sources.
+
+    With include_facts=false, only per-type fact counts are returned
+    instead of every fact, for callers that just need the overview.
     """
     clusterer = FactClusterer(db)
 
-    summary = clusterer.get_cluster_summary(cluster_id)
+    # Conflicts are detected from the facts the summary already loads
+    summary = clusterer.get_cluster_summary(
+        cluster_id,
+        include_conflicts=True,
+        include_facts=include_facts
+    )
 
     if not summary:
         raise HTTPException(status_code=404, detail="Cluster not found")
 
-    # Add conflict detection
-    conflicts = clusterer.detect_conflicts(cluster_id)
-    summary['conflicts'] = conflicts
-
     return summary
 
 
 @app.get("/api/clusters/{cluster_id}/corroboration")
-async def get_cluster_corroboration(
+def get_cluster_corroboration(
     cluster_id: int,
     db: Session = Depends(get_db)
 ):
@@ -472,7 +656,7 @@ async def get_cluster_corroboration(
 
 
 @app.get("/api/matching/test")
-async def test_matching(
+def test_matching(
     name1: str,
     name2: str,
     db: Session = Depends(get_db)
@@ -499,11 +683,10 @@ async def test_matching(
 # ============================================================================
 
 @app.get("/api/gramps/health")
-async def gramps_health_check():
+def gramps_health_check(gramps: GrampsClient = Depends(get_gramps_client)):
     """
     Check if Gramps Web is accessible.
     """
-    gramps = GrampsClient()
     is_healthy = gramps.health_check()
 
     return {
@@ -514,19 +697,18 @@ async def gramps_health_check():
 
 
 @app.get("/api/gramps/search")
-async def search_gramps_people(
+def search_gramps_people(
     query: str = None,
     surname: str = None,
     given_name: str = None,
-    limit: int = 10
+    limit: int = 10,
+    gramps: GrampsClient = Depends(get_gramps_client)
 ):
     """
     Search Gramps Web for people.
 
     Direct passthrough to Gramps API for testing.
     """
-    gramps = GrampsClient()
-
     results = gramps.search_people(
         query=query,
         surname=surname,
@@ -540,21 +722,46 @@ async def search_gramps_people(
     }
 
 
+# Gramps match results are reused per cluster for this many seconds:
+# matching fetches every Gramps person plus their events, and the UI asks
+# again each time a cluster is opened. Cleared once cluster or Gramps link
+# writes have finished; the generation count stops a lookup that started
+# before such a write from storing its stale result afterwards
+GRAMPS_MATCH_CACHE_TTL = 60
+_gramps_match_cache = {}  # cluster_id -> (computed_at, result)
+_gramps_match_generation = 0
+
+
+def _invalidate_gramps_matches():
+    """Drop cached Gramps matches after clusters or their links change"""
+    global _gramps_match_generation
+    _gramps_match_generation += 1
+    _gramps_match_cache.clear()
+
+
 @app.get("/api/clusters/{cluster_id}/gramps-matches")
-async def find_gramps_matches(
+def find_gramps_matches(
     cluster_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    gramps: GrampsClient = Depends(get_gramps_client)
 ):
     """
     Find potential Gramps Web matches for a person cluster.
 
     READ-ONLY: Does not modify Gramps data.
     """
-    matcher = GrampsMatcher(db)
+    generation = _gramps_match_generation
+    cached = _gramps_match_cache.get(cluster_id)
+    if cached:
+        if time.monotonic() - cached[0] < GRAMPS_MATCH_CACHE_TTL:
+            return cached[1]
+        _gramps_match_cache.pop(cluster_id, None)
+
+    matcher = GrampsMatcher(db, gramps)
 
     matches = matcher.find_matches_for_cluster(cluster_id)
 
-    return {
+    result = {
         'cluster_id': cluster_id,
         'matches_found': len(matches),
         'matches': [
@@ -571,6 +778,16 @@ async def find_gramps_matches(
             for m in matches
         ]
     }
+    now = time.monotonic()
+    # Sweep expired entries on each store so the map only holds clusters
+    # looked at within the TTL
+    for cached_id, (computed_at, _) in list(_gramps_match_cache.items()):
+        if now - computed_at >= GRAMPS_MATCH_CACHE_TTL:
+            _gramps_match_cache.pop(cached_id, None)
+    if generation == _gramps_match_generation:
+        _gramps_match_cache[cluster_id] = (now, result)
+
+    return result
 
 
 # ============================================================================
@@ -585,10 +802,11 @@ class LinkGrampsRequest(BaseModel):
 
 
 @app.post("/api/clusters/{cluster_id}/link-gramps")
-async def link_cluster_to_gramps(
+def link_cluster_to_gramps(
     cluster_id: int,
     request: LinkGrampsRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    gramps: GrampsClient = Depends(get_gramps_client)
 ):
     """
     Link a person cluster to a Gramps person and create citations.
@@ -599,14 +817,17 @@ async def link_cluster_to_gramps(
     3. Creates citation records linking persons to sources
     4. Records all writes in local gramps_citations table
     """
-    citation_service = CitationService(db)
+    citation_service = CitationService(db, gramps)
 
-    result = citation_service.link_cluster_to_gramps(
-        cluster_id=cluster_id,
-        gramps_person_id=request.gramps_person_id,
-        gramps_handle=request.gramps_handle,
-        confidence=request.confidence
-    )
+    try:
+        result = citation_service.link_cluster_to_gramps(
+            cluster_id=cluster_id,
+            gramps_person_id=request.gramps_person_id,
+            gramps_handle=request.gramps_handle,
+            confidence=request.confidence
+        )
+    finally:
+        _invalidate_gramps_matches()
 
     if not result.get('success'):
         raise HTTPException(status_code=400, detail=result.get('error', 'Unknown error'))
@@ -615,14 +836,15 @@ async def link_cluster_to_gramps(
 
 
 @app.get("/api/clusters/{cluster_id}/citations")
-async def get_cluster_citations(
+def get_cluster_citations(
     cluster_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    gramps: GrampsClient = Depends(get_gramps_client)
 ):
     """
     Get all citations created for a person cluster.
     """
-    citation_service = CitationService(db)
+    citation_service = CitationService(db, gramps)
 
     citations = citation_service.get_cluster_citations(cluster_id)
 
@@ -634,9 +856,10 @@ async def get_cluster_citations(
 
 
 @app.delete("/api/clusters/{cluster_id}/gramps-link")
-async def unlink_cluster_from_gramps(
+def unlink_cluster_from_gramps(
     cluster_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    gramps: GrampsClient = Depends(get_gramps_client)
 ):
     """
     Remove Gramps link from a cluster.
@@ -644,9 +867,12 @@ async def unlink_cluster_from_gramps(
     Note: This does NOT delete data from Gramps Web.
     It only removes the link in our local database.
     """
-    citation_service = CitationService(db)
+    citation_service = CitationService(db, gramps)
 
-    result = citation_service.unlink_cluster(cluster_id)
+    try:
+        result = citation_service.unlink_cluster(cluster_id)
+    finally:
+        _invalidate_gramps_matches()
 
     if not result.get('success'):
         raise HTTPException(status_code=400, detail=result.get('error', 'Unknown error'))
@@ -655,14 +881,15 @@ async def unlink_cluster_from_gramps(
 
 
 @app.get("/api/gramps/person/{gramps_person_id}/citations")
-async def get_gramps_person_citations(
+def get_gramps_person_citations(
     gramps_person_id: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    gramps: GrampsClient = Depends(get_gramps_client)
 ):
     """
     Get all citations we've created for a Gramps person.
     """
-    citation_service = CitationService(db)
+    citation_service = CitationService(db, gramps)
 
     citations = citation_service.get_person_citations(gramps_person_id)
 
@@ -674,16 +901,17 @@ async def get_gramps_person_citations(
 
 
 @app.get("/api/gramps/audit-trail")
-async def get_gramps_audit_trail(
+def get_gramps_audit_trail(
     limit: int = 50,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    gramps: GrampsClient = Depends(get_gramps_client)
 ):
     """
     Get audit trail of all citations created in Gramps.
 
     Shows recent citations with readable obituary names for easy review.
     """
-    citation_service = CitationService(db)
+    citation_service = CitationService(db, gramps)
 
     citations = citation_service.get_audit_trail(limit=limit)
 
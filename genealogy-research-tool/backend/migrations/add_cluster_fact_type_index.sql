@@ -0,0 +1,5 @@
+-- Composite index for per-cluster fact reads filtered by fact type
+-- (conflict detection), so only the matching facts' rows are read
+
+ALTER TABLE extracted_facts
+ADD INDEX idx_cluster_fact_type (person_cluster_id, fact_type);
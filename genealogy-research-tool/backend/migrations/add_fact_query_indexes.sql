@@ -0,0 +1,9 @@
+-- Composite indexes for the hottest extracted_facts lookups and the
+-- citation audit trail ordering
+
+ALTER TABLE extracted_facts
+ADD INDEX idx_subject_obituary (subject_name, obituary_cache_id),
+ADD INDEX idx_obituary_role_type (obituary_cache_id, subject_role, fact_type);
+
+ALTER TABLE gramps_citations
+ADD INDEX ix_gramps_citations_created_timestamp (created_timestamp);
@@ -0,0 +1,6 @@
+-- url_hash is the hash of the (unique) obituary URL, so its lookup index
+-- can be unique too: cache lookups stop after the one matching row
+
+ALTER TABLE obituary_cache
+DROP INDEX idx_url_hash,
+ADD UNIQUE INDEX idx_url_hash (url_hash);
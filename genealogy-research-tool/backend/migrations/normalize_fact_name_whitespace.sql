@@ -0,0 +1,10 @@
+-- Collapse runs of whitespace in extracted fact names to match what the
+-- ExtractedFact model now stores, so equal names compare and group equal
+
+UPDATE extracted_facts
+SET subject_name = TRIM(REGEXP_REPLACE(subject_name, '[[:space:]]+', ' '))
+WHERE subject_name REGEXP '^[[:space:]]|[[:space:]]$|[[:space:]]{2}|[\t\n\r]';
+
+UPDATE extracted_facts
+SET related_name = TRIM(REGEXP_REPLACE(related_name, '[[:space:]]+', ' '))
+WHERE related_name REGEXP '^[[:space:]]|[[:space:]]$|[[:space:]]{2}|[\t\n\r]';
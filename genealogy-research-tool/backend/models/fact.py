@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, Boolean, Enum, DECIMAL, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, Boolean, Enum, DECIMAL, ForeignKey, Index
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from .database import Base
 
@@ -82,25 +82,65 @@ class ExtractedFact(Base):
     # Relationships
     obituary = relationship("ObituaryCache", back_populates="extracted_facts")
 
+    __table_args__ = (
+        # Covers per-name obituary counts (GROUP BY subject_name with
+        # COUNT(DISTINCT obituary_cache_id)) without reading table rows
+        Index('idx_subject_obituary', 'subject_name', 'obituary_cache_id'),
+        # Deceased primary name lookup per obituary for citations
+        Index('idx_obituary_role_type', 'obituary_cache_id', 'subject_role', 'fact_type'),
+        # Per-cluster fact reads filtered by type (conflict detection)
+        Index('idx_cluster_fact_type', 'person_cluster_id', 'fact_type'),
+    )
+
+    @validates('subject_name', 'related_name')
+    def validate_name(self, key, value):
+        """Collapse whitespace so the same name is always stored the same way"""
+        if value is None:
+            return value
+        return ' '.join(value.split())
+
     def __repr__(self):
         return (f"<ExtractedFact(id={self.id}, type='{self.fact_type}', "
                 f"subject='{self.subject_name}', confidence={self.confidence_score})>")
 
     def to_dict(self):
         """Convert to dictionary for API responses"""
+        return self.row_to_dict(self)
+
+    @classmethod
+    def dict_columns(cls):
+        """Columns read by to_dict, for queries that skip building ORM objects"""
+        return (
+            cls.id,
+            cls.fact_type,
+            cls.subject_name,
+            cls.subject_role,
+            cls.fact_value,
+            cls.related_name,
+            cls.relationship_type,
+            cls.extracted_context,
+            cls.is_inferred,
+            cls.inference_basis,
+            cls.confidence_score,
+            cls.resolution_status,
+        )
+
+    @staticmethod
+    def row_to_dict(row):
+        """API dict for a fact or a row selected with dict_columns()"""
         return {
-            'id': self.id,
-            'fact_type': self.fact_type,
-            'subject_name': self.subject_name,
-            'subject_role': self.subject_role,
-            'fact_value': self.fact_value,
-            'related_name': self.related_name,
-            'relationship_type': self.relationship_type,
-            'extracted_context': self.extracted_context,
-            'is_inferred': self.is_inferred,
-            'inference_basis': self.inference_basis,
-            'confidence_score': float(self.confidence_score) if self.confidence_score else None,
-            'resolution_status': self.resolution_status,
+            'id': row.id,
+            'fact_type': row.fact_type,
+            'subject_name': row.subject_name,
+            'subject_role': row.subject_role,
+            'fact_value': row.fact_value,
+            'related_name': row.related_name,
+            'relationship_type': row.relationship_type,
+            'extracted_context': row.extracted_context,
+            'is_inferred': row.is_inferred,
+            'inference_basis': row.inference_basis,
+            'confidence_score': float(row.confidence_score) if row.confidence_score else None,
+            'resolution_status': row.resolution_status,
         }
 
 
@@ -158,7 +198,7 @@ class GrampsCitation(Base):
     confidence = Column(Enum('very_high', 'high', 'medium', 'low'), default='high')
 
     # Metadata
-    created_timestamp = Column(TIMESTAMP, server_default=func.current_timestamp())
+    created_timestamp = Column(TIMESTAMP, server_default=func.current_timestamp(), index=True)
     created_by = Column(String(100), default='genealogy_tool')
 
     # Relationships
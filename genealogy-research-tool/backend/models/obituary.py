@@ -10,7 +10,7 @@ class ObituaryCache(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     url = Column(String(2048), unique=True, nullable=False)
-    url_hash = Column(String(64), nullable=False, index=True)
+    url_hash = Column(String(64), unique=True, nullable=False, index=True)
     content_hash = Column(String(64))
     raw_html = Column(Text)
     extracted_text = Column(Text)
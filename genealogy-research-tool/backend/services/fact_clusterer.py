@@ -7,15 +7,46 @@ Two-level clustering:
 """
 
 from typing import List, Dict, Set, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import distinct
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import case, distinct, func, insert, select, update
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 import json
+import unicodedata
 
 from models import ExtractedFact, PersonCluster, ObituaryCache
 from services.person_matcher import PersonMatcher
 
 
+# Single-valued fact types whose values should agree across sources
+# (a tuple, as it is passed straight to in_())
+CONFLICT_FACT_TYPES = ('person_death_date', 'person_birth_date', 'person_death_age')
+
+# Fact types that describe a relationship to another named person
+RELATIONSHIP_FACT_TYPES = frozenset({'relationship', 'marriage'})
+
+# Rows fetched per batch when streaming the full fact table
+FACT_STREAM_BATCH_SIZE = 1000
+
+# Facts linked to their clusters per UPDATE statement
+FACT_LINK_BATCH_SIZE = 1000
+
+# Names whose collation keys are kept between clustering runs
+COLLATION_KEY_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=COLLATION_KEY_CACHE_SIZE)
+def collation_key(name: str) -> str:
+    """
+    Fold a name the way the utf8mb4_unicode_ci column compares it: accents
+    and case are ignored, so 'José García' and 'jose garcia' share a key.
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return stripped.casefold()
+
+
 class FactClusterer:
     """
     Clusters facts about the same person across obituaries.
@@ -57,11 +88,35 @@ class FactClusterer:
             - confidence
         """
         # Get all unique subject names
-        all_names_result = self.db.query(distinct(ExtractedFact.subject_name)).all()
-        all_names = [name[0] for name in all_names_result]
+        all_names = self.db.scalars(select(distinct(ExtractedFact.subject_name))).all()
 
         print(f"Clustering {len(all_names)} unique names across obituaries...")
 
+        # Load all facts once, keyed by subject name folded like the column
+        # collation (case and accent insensitive, so each distinct name above
+        # finds every spelling the database grouped into it), instead of
+        # querying per cluster.
+        # Only the columns clustering reads are loaded; the context and
+        # source sentence text columns are the bulk of each row
+        facts_by_name = defaultdict(list)
+        cluster_columns = load_only(
+            ExtractedFact.subject_name,
+            ExtractedFact.obituary_cache_id,
+            ExtractedFact.fact_type,
+            ExtractedFact.fact_value,
+            ExtractedFact.confidence_score
+        )
+        fact_rows = self.db.query(ExtractedFact).options(cluster_columns)
+        for fact in fact_rows.yield_per(FACT_STREAM_BATCH_SIZE):
+            facts_by_name[collation_key(fact.subject_name)].append(fact)
+
+        # Block names by surname so each name is only compared with names
+        # the matcher could accept (same or phonetically similar surname)
+        surname_blocks = defaultdict(list)
+        for index, name in enumerate(all_names):
+            for key in self.matcher.surname_block_keys(name):
+                surname_blocks[key].append(index)
+
         clusters = []
         processed = set()
 
@@ -74,7 +129,16 @@ class FactClusterer:
             processed.add(target_name)
 
             # Find fuzzy matches
-            remaining_names = [n for n in all_names if n not in processed]
+            probe_keys = self.matcher.surname_probe_keys(target_name)
+            if probe_keys is None:
+                candidate_names = all_names
+            else:
+                candidate_indices = set()
+                for key in probe_keys:
+                    candidate_indices.update(surname_blocks.get(key, ()))
+                candidate_names = [all_names[i] for i in sorted(candidate_indices)]
+
+            remaining_names = [n for n in candidate_names if n not in processed]
             matches = self.matcher.find_potential_matches(
                 target_name,
                 remaining_names,
@@ -88,9 +152,11 @@ class FactClusterer:
                     processed.add(matched_name)
 
             # Get all facts for all variants in this cluster
-            all_facts = self.db.query(ExtractedFact).filter(
-                ExtractedFact.subject_name.in_(cluster_variants)
-            ).all()
+            all_facts = [
+                fact
+                for variant_key in sorted({collation_key(v) for v in cluster_variants})
+                for fact in facts_by_name.get(variant_key, [])
+            ]
 
             if not all_facts:
                 continue
@@ -101,12 +167,15 @@ class FactClusterer:
             # Calculate cluster confidence (average of all facts)
             avg_confidence = sum(float(f.confidence_score) for f in all_facts) / len(all_facts)
 
-            # Determine canonical name (longest/most complete)
-            canonical = max(cluster_variants, key=len)
+            # Determine canonical name (longest/most complete). Ties go to
+            # the first variant in sorted order, not set order, which follows
+            # the per-process string hash seed
+            name_variants = sorted(cluster_variants)
+            canonical = max(name_variants, key=len)
 
             clusters.append({
                 'canonical_name': canonical,
-                'name_variants': sorted(list(cluster_variants)),
+                'name_variants': name_variants,
                 'facts': all_facts,
                 'fact_count': len(all_facts),
                 'obituary_count': len(obituary_ids),
@@ -115,7 +184,7 @@ class FactClusterer:
             })
 
         # Sort by obituary count (most corroborated first)
-        clusters.sort(key=lambda c: (c['obituary_count'], c['fact_count']), reverse=True)
+        clusters.sort(key=itemgetter('obituary_count', 'fact_count'), reverse=True)
 
         print(f"Created {len(clusters)} person clusters")
         print(f"  - {sum(1 for c in clusters if c['obituary_count'] > 1)} people in multiple obituaries")
@@ -135,11 +204,11 @@ class FactClusterer:
             ExtractedFact.resolution_status: 'unresolved'
         })
 
-        # Delete existing clusters
+        # Delete existing clusters (same transaction, so the clustered facts
+        # stay loaded and a failure below leaves the old clusters in place)
         self.db.query(PersonCluster).delete()
-        self.db.commit()
 
-        cluster_records = []
+        cluster_rows = []
 
         for cluster_data in clusters:
             # Extract nicknames and maiden names from facts
@@ -152,27 +221,50 @@ class FactClusterer:
                 elif fact.fact_type == 'maiden_name':
                     maiden_names.add(fact.fact_value)
 
-            # Create cluster record
-            cluster = PersonCluster(
-                canonical_name=cluster_data['canonical_name'],
-                name_variants=json.dumps(cluster_data['name_variants']),
-                nicknames=json.dumps(list(nicknames)) if nicknames else None,
-                maiden_names=json.dumps(list(maiden_names)) if maiden_names else None,
-                confidence_score=cluster_data['confidence'],
-                source_count=cluster_data['obituary_count'],
-                fact_count=cluster_data['fact_count'],
-                cluster_status='verified' if cluster_data['obituary_count'] > 1 else 'unverified'
-            )
-
-            self.db.add(cluster)
-            self.db.flush()  # Get the ID
+            # Cluster record values
+            cluster_rows.append({
+                'canonical_name': cluster_data['canonical_name'],
+                'name_variants': json.dumps(cluster_data['name_variants']),
+                'nicknames': json.dumps(sorted(nicknames)) if nicknames else None,
+                'maiden_names': json.dumps(sorted(maiden_names)) if maiden_names else None,
+                'confidence_score': cluster_data['confidence'],
+                'source_count': cluster_data['obituary_count'],
+                'fact_count': cluster_data['fact_count'],
+                'cluster_status': 'verified' if cluster_data['obituary_count'] > 1 else 'unverified'
+            })
 
-            # Link all facts to this cluster
-            for fact in cluster_data['facts']:
-                fact.person_cluster_id = cluster.id
-                fact.resolution_status = 'clustered'
+        # ORM bulk INSERT ... RETURNING: the rows go out as multi-row
+        # INSERTs and come back with their IDs, in input order, without
+        # each record passing through the unit of work
+        cluster_records = []
+        if cluster_rows:
+            cluster_records = self.db.scalars(
+                insert(PersonCluster).returning(PersonCluster, sort_by_parameter_order=True),
+                cluster_rows
+            ).all()
 
-            cluster_records.append(cluster)
+        # Link all facts to their clusters. An executemany UPDATE by primary
+        # key is still one statement per fact on MySQL, so each batch is a
+        # single UPDATE that picks the cluster ID with a CASE on the fact ID
+        fact_clusters = {
+            fact.id: cluster.id
+            for cluster, cluster_data in zip(cluster_records, clusters)
+            for fact in cluster_data['facts']
+        }
+        fact_ids = list(fact_clusters)
+        for start in range(0, len(fact_ids), FACT_LINK_BATCH_SIZE):
+            batch = fact_ids[start:start + FACT_LINK_BATCH_SIZE]
+            self.db.execute(
+                update(ExtractedFact).where(
+                    ExtractedFact.id.in_(batch)
+                ).values(
+                    person_cluster_id=case(
+                        {fact_id: fact_clusters[fact_id] for fact_id in batch},
+                        value=ExtractedFact.id
+                    ),
+                    resolution_status='clustered'
+                ).execution_options(synchronize_session=False)
+            )
 
         self.db.commit()
 
@@ -180,9 +272,19 @@ class FactClusterer:
 
         return cluster_records
 
-    def get_cluster_summary(self, cluster_id: int) -> Optional[Dict]:
+    def get_cluster_summary(
+        self,
+        cluster_id: int,
+        include_conflicts: bool = False,
+        include_facts: bool = True
+    ) -> Optional[Dict]:
         """
         Get detailed summary of a person cluster.
+
+        With include_conflicts, the summary also gets a 'conflicts' list
+        (as from detect_conflicts) built from the facts already loaded.
+        Without include_facts, 'facts_by_type' is replaced by
+        'fact_counts_by_type', counted in SQL, so no fact is serialized.
         """
         cluster = self.db.query(PersonCluster).filter(
             PersonCluster.id == cluster_id
@@ -191,22 +293,55 @@ class FactClusterer:
         if not cluster:
             return None
 
-        facts = self.db.query(ExtractedFact).filter(
-            ExtractedFact.person_cluster_id == cluster_id
-        ).all()
-
-        # Group facts by type
-        facts_by_type = defaultdict(list)
-        for fact in facts:
-            facts_by_type[fact.fact_type].append(fact)
+        if include_facts:
+            # Only the columns the summary reads, as plain rows: skips
+            # building ORM objects and loading the facts' source text
+            facts = self.db.query(
+                ExtractedFact.fact_type,
+                ExtractedFact.fact_value,
+                ExtractedFact.confidence_score,
+                ExtractedFact.is_inferred,
+                ExtractedFact.extracted_context,
+                ExtractedFact.obituary_cache_id
+            ).filter(
+                ExtractedFact.person_cluster_id == cluster_id
+            ).order_by(ExtractedFact.id).all()
+
+            # Group facts by type
+            facts_by_type = defaultdict(list)
+            for fact in facts:
+                facts_by_type[fact.fact_type].append(fact)
 
-        # Get obituary sources
-        obituary_ids = list(set(f.obituary_cache_id for f in facts))
-        obituaries = self.db.query(ObituaryCache).filter(
+            obituary_ids = list(set(f.obituary_cache_id for f in facts))
+        else:
+            # One grouped count gives both the per-type counts and the
+            # obituaries the facts come from
+            fact_counts_by_type = defaultdict(int)
+            obituary_ids = set()
+            for fact_type, obituary_id, count in self.db.query(
+                ExtractedFact.fact_type,
+                ExtractedFact.obituary_cache_id,
+                func.count(ExtractedFact.id)
+            ).filter(
+                ExtractedFact.person_cluster_id == cluster_id
+            ).group_by(
+                ExtractedFact.fact_type,
+                ExtractedFact.obituary_cache_id
+            ):
+                fact_counts_by_type[fact_type] += count
+                obituary_ids.add(obituary_id)
+            obituary_ids = list(obituary_ids)
+
+        # Get obituary sources (without their raw HTML and text)
+        obituaries = self.db.query(
+            ObituaryCache.id,
+            ObituaryCache.url,
+            ObituaryCache.fetch_timestamp
+        ).filter(
             ObituaryCache.id.in_(obituary_ids)
         ).all()
 
-        return {
+        summary = {
             'cluster_id': cluster.id,
             'canonical_name': cluster.canonical_name,
             'name_variants': json.loads(cluster.name_variants),
@@ -224,8 +359,11 @@ class FactClusterer:
                     'fetch_timestamp': obit.fetch_timestamp.isoformat() if obit.fetch_timestamp else None
                 }
                 for obit in obituaries
-            ],
-            'facts_by_type': {
+            ]
+        }
+
+        if include_facts:
+            summary['facts_by_type'] = {
                 fact_type: [
                     {
                         'fact_value': f.fact_value,
@@ -238,7 +376,16 @@ class FactClusterer:
                 ]
                 for fact_type, facts_list in facts_by_type.items()
             }
-        }
+        else:
+            summary['fact_counts_by_type'] = dict(fact_counts_by_type)
+
+        if include_conflicts:
+            if include_facts:
+                summary['conflicts'] = self._find_conflicts(facts)
+            else:
+                summary['conflicts'] = self.detect_conflicts(cluster_id)
+
+        return summary
 
     def detect_conflicts(self, cluster_id: int) -> List[Dict]:
         """
@@ -249,16 +396,31 @@ class FactClusterer:
         - Death dates that don't match
         - Conflicting relationships
         """
-        facts = self.db.query(ExtractedFact).filter(
-            ExtractedFact.person_cluster_id == cluster_id
-        ).all()
+        facts = self.db.query(ExtractedFact).options(
+            load_only(
+                ExtractedFact.obituary_cache_id,
+                ExtractedFact.fact_type,
+                ExtractedFact.fact_value,
+                ExtractedFact.confidence_score
+            )
+        ).filter(
+            ExtractedFact.person_cluster_id == cluster_id,
+            # Only the fact types that can conflict leave the database
+            ExtractedFact.fact_type.in_(CONFLICT_FACT_TYPES)
+        ).order_by(ExtractedFact.id).all()
+
+        return self._find_conflicts(facts)
 
+    def _find_conflicts(self, facts: List[ExtractedFact]) -> List[Dict]:
+        """
+        Find conflicting values among a cluster's facts (in id order).
+        """
         conflicts = []
 
         # Group by fact type
         facts_by_type = defaultdict(list)
         for fact in facts:
-            if fact.fact_type in ['person_death_date', 'person_birth_date', 'person_death_age']:
+            if fact.fact_type in CONFLICT_FACT_TYPES:
                 facts_by_type[fact.fact_type].append(fact)
 
         # Check for conflicting values
@@ -270,7 +432,7 @@ class FactClusterer:
             if len(values) > 1:
                 conflicts.append({
                     'fact_type': fact_type,
-                    'conflicting_values': list(values),
+                    'conflicting_values': sorted(values),
                     'sources': [
                         {
                             'value': f.fact_value,
@@ -289,16 +451,26 @@ class FactClusterer:
 
         Multi-source corroboration increases confidence.
         """
-        facts = self.db.query(ExtractedFact).filter(
+        # Stream just the columns used below as plain rows instead of
+        # materializing every fact (source text included) as an ORM object
+        facts = self.db.query(
+            ExtractedFact.fact_type,
+            ExtractedFact.fact_value,
+            ExtractedFact.relationship_type,
+            ExtractedFact.related_name,
+            ExtractedFact.obituary_cache_id,
+            ExtractedFact.confidence_score,
+            ExtractedFact.extracted_context
+        ).filter(
             ExtractedFact.person_cluster_id == cluster_id
-        ).all()
+        ).yield_per(FACT_STREAM_BATCH_SIZE)
 
         # Group identical facts from different sources
         # For relationships, include related_name in the key
         fact_groups = defaultdict(list)
 
         for fact in facts:
-            if fact.fact_type in ['relationship', 'marriage']:
+            if fact.fact_type in RELATIONSHIP_FACT_TYPES:
                 # For relationships, group by (type, relationship_type, related_name)
                 rel = fact.relationship_type or fact.fact_value or 'unknown'
                 person = fact.related_name or 'unknown'
@@ -313,41 +485,39 @@ class FactClusterer:
             source_count = len(set(f.obituary_cache_id for f in fact_list))
 
             if source_count > 1:
+                # Convert each DECIMAL confidence once; the average is
+                # taken over the same floats the sources report
+                sources = [
+                    {
+                        'obituary_id': f.obituary_cache_id,
+                        'confidence': float(f.confidence_score),
+                        'extracted_context': f.extracted_context
+                    }
+                    for f in fact_list
+                ]
+                avg_confidence = sum(source['confidence'] for source in sources) / len(sources)
+
                 fact_type = key[0]
-                if fact_type in ['relationship', 'marriage']:
+                if fact_type in RELATIONSHIP_FACT_TYPES:
                     corroborated.append({
                         'fact_type': fact_type,
                         'relationship_type': key[1],
                         'related_name': key[2],
                         'fact_value': fact_list[0].fact_value,
                         'source_count': source_count,
-                        'avg_confidence': sum(float(f.confidence_score) for f in fact_list) / len(fact_list),
-                        'sources': [
-                            {
-                                'obituary_id': f.obituary_cache_id,
-                                'confidence': float(f.confidence_score),
-                                'extracted_context': f.extracted_context
-                            }
-                            for f in fact_list
-                        ]
+                        'avg_confidence': avg_confidence,
+                        'sources': sources
                     })
                 else:
                     corroborated.append({
                         'fact_type': fact_type,
                         'fact_value': key[1],
                         'source_count': source_count,
-                        'avg_confidence': sum(float(f.confidence_score) for f in fact_list) / len(fact_list),
-                        'sources': [
-                            {
-                                'obituary_id': f.obituary_cache_id,
-                                'confidence': float(f.confidence_score),
-                                'extracted_context': f.extracted_context
-                            }
-                            for f in fact_list
-                        ]
+                        'avg_confidence': avg_confidence,
+                        'sources': sources
                     })
 
         # Sort by source count (most corroborated first)
-        corroborated.sort(key=lambda x: x['source_count'], reverse=True)
+        corroborated.sort(key=itemgetter('source_count'), reverse=True)
 
         return corroborated
@@ -4,9 +4,9 @@ Service for creating and managing citations in Gramps Web.
 Links person clusters to Gramps people with proper source/citation records.
 """
 
-from typing import List, Dict, Optional, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import List, Dict, Optional, Set, Tuple
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, case
 
 from models import PersonCluster, ObituaryCache, GrampsCitation, ExtractedFact
 from services.gramps_client import GrampsClient
@@ -51,18 +51,18 @@ class CitationService:
         Returns:
             Dict with results including citations created
         """
-        # Get cluster
-        cluster = self.db.query(PersonCluster).filter(
+        # Update cluster with Gramps ID in one UPDATE (no row is loaded);
+        # no matched row means there is no such cluster
+        updated = self.db.query(PersonCluster).filter(
             PersonCluster.id == cluster_id
-        ).first()
+        ).update({
+            'gramps_person_id': gramps_person_id,
+            'cluster_status': 'verified'
+        })
 
-        if not cluster:
+        if not updated:
             return {'success': False, 'error': 'Cluster not found'}
 
-        # Update cluster with Gramps ID
-        cluster.gramps_person_id = gramps_person_id
-        cluster.cluster_status = 'verified'
-
         # Update all facts in this cluster with gramps_person_id
         self.db.query(ExtractedFact).filter(
             ExtractedFact.person_cluster_id == cluster_id
@@ -71,34 +71,135 @@ class CitationService:
             'resolution_status': 'resolved'
         })
 
-        # Get all obituaries that contributed facts to this cluster
-        obituary_ids = self.db.query(ExtractedFact.obituary_cache_id).filter(
+        # Get all obituaries that contributed facts to this cluster, with
+        # their URLs (None if the obituary row is missing) and any citation
+        # this person already has for them joined in, so the citation work
+        # below needs no further obituary or citation queries
+        obituary_rows = self.db.query(
+            ExtractedFact.obituary_cache_id,
+            ObituaryCache.url,
+            GrampsCitation.id
+        ).outerjoin(
+            ObituaryCache, ObituaryCache.id == ExtractedFact.obituary_cache_id
+        ).outerjoin(
+            GrampsCitation,
+            and_(
+                GrampsCitation.obituary_cache_id == ExtractedFact.obituary_cache_id,
+                GrampsCitation.gramps_person_id == gramps_person_id
+            )
+        ).filter(
             ExtractedFact.person_cluster_id == cluster_id
-        ).distinct().all()
+        ).distinct()
+
+        obituary_urls = {}
+        existing_citations = {}
+        for obit_id, url, citation_id in obituary_rows:
+            obituary_urls[obit_id] = url
+            if citation_id is not None:
+                existing_citations[obit_id] = citation_id
+        obituary_ids = sorted(obituary_urls)
+
+        # Obituaries that already have a citation for this person are skipped
+        citations_skipped = [
+            {
+                'skipped': True,
+                'reason': 'Citation already exists',
+                'citation_id': existing_citations[obit_id]
+            }
+            for obit_id in obituary_ids
+            if obit_id in existing_citations
+        ]
+        new_obituary_ids = [oid for oid in obituary_ids if oid not in existing_citations]
+
+        # Load the deceased names up front so the worker threads below
+        # only talk to Gramps, never to the session
+        deceased_names = {}
+        if new_obituary_ids:
+            name_facts = self.db.query(
+                ExtractedFact.obituary_cache_id,
+                ExtractedFact.fact_value
+            ).filter(
+                and_(
+                    ExtractedFact.obituary_cache_id.in_(new_obituary_ids),
+                    ExtractedFact.subject_role == 'deceased_primary',
+                    ExtractedFact.fact_type == 'person_name'
+                )
+            ).order_by(ExtractedFact.id)
+            for obit_id, fact_value in name_facts:
+                deceased_names.setdefault(obit_id, fact_value)
+
+        # Find or create each source one at a time against the source list
+        # fetched once, so two obituaries never race to create a source
+        sources = {}
+        if new_obituary_ids:
+            source_index = self.gramps.get_source_index()
+            for obit_id in new_obituary_ids:
+                if obituary_urls.get(obit_id):
+                    sources[obit_id] = self.gramps.find_or_create_source(
+                        title=f"Obituary of {deceased_names.get(obit_id, 'Unknown')}",
+                        url=obituary_urls[obit_id],
+                        author=None,
+                        pubinfo=None,
+                        source_index=source_index
+                    )
 
-        obituary_ids = [oid[0] for oid in obituary_ids]
+        # Citations are independent of each other, so they are created in
+        # Gramps concurrently on the client's workers; each only waits on
+        # the network
+        results = self.gramps.map_concurrently(
+            lambda obit_id: self._create_citation_for_obituary(
+                obituary_url=obituary_urls.get(obit_id),
+                deceased_name=deceased_names.get(obit_id, "Unknown"),
+                source=sources.get(obit_id),
+                confidence=confidence
+            ),
+            new_obituary_ids
+        )
 
-        # Create citations for each obituary
         citations_created = []
-        citations_skipped = []
-
-        for obit_id in obituary_ids:
-            result = self._create_citation_for_obituary(
-                obituary_cache_id=obit_id,
-                cluster_id=cluster_id,
-                gramps_person_id=gramps_person_id,
-                gramps_handle=gramps_handle,
-                confidence=confidence
-            )
+        citation_rows = []
+        citation_handles = []
 
-            if result.get('success'):
-                citations_created.append(result)
-            elif result.get('skipped'):
-                citations_skipped.append(result)
-            else:
+        for obit_id, result in zip(new_obituary_ids, results):
+            if not result.get('success'):
                 # Log error but continue
                 print(f"Failed to create citation for obituary {obit_id}: {result.get('error')}")
+                continue
+
+            if result['citation_handle']:
+                citation_handles.append(result['citation_handle'])
+
+            # Record in our database (with denormalized obituary_name for audit trail)
+            citation_rows.append({
+                'obituary_cache_id': obit_id,
+                'person_cluster_id': cluster_id,
+                'gramps_person_id': gramps_person_id,
+                'gramps_source_id': result['gramps_source_id'],
+                'gramps_citation_id': result['gramps_citation_id'],
+                'citation_type': 'obituary',
+                'obituary_name': f"Obituary of {result['deceased_name']}",
+                'confidence': confidence
+            })
+
+            citations_created.append({
+                'success': True,
+                'obituary_id': obit_id,
+                'gramps_source_id': result['gramps_source_id'],
+                'gramps_citation_id': result['gramps_citation_id'],
+                'local_citation_id': 'pending'
+            })
 
+        # Add all new citations to the person in Gramps with one update
+        if citation_handles:
+            self.gramps.add_citations_to_person(
+                person_handle=gramps_handle,
+                citation_handles=citation_handles
+            )
+
+        # Nothing reads the new rows back, so insert them as plain
+        # mappings instead of tracking each object in the session
+        if citation_rows:
+            self.db.bulk_insert_mappings(GrampsCitation, citation_rows)
         self.db.commit()
 
         return {
@@ -112,118 +213,62 @@ class CitationService:
 
     def _create_citation_for_obituary(
         self,
-        obituary_cache_id: int,
-        cluster_id: int,
-        gramps_person_id: str,
-        gramps_handle: str,
+        obituary_url: Optional[str],
+        deceased_name: str,
+        source: Optional[Tuple[str, str]],
         confidence: str = 'high'
     ) -> Dict:
         """
-        Create a citation linking an obituary to a Gramps person.
+        Create the Gramps citation for one obituary.
+
+        Only talks to Gramps (no database access), so it can run on a
+        worker thread. Errors are returned rather than raised, so one
+        failed obituary never loses the citations already made for the
+        others. The caller records the citation locally and adds it to
+        the person.
 
         Args:
-            obituary_cache_id: ObituaryCache ID
-            cluster_id: PersonCluster ID
-            gramps_person_id: Gramps person ID
-            gramps_handle: Gramps person handle
+            obituary_url: Obituary URL, or None if the obituary is missing
+            deceased_name: Name of the deceased primary person
+            source: (gramps_id, handle) of the obituary's source, or None
+                if it couldn't be found or created
             confidence: Confidence level
 
         Returns:
-            Dict with citation details or error
+            Dict with Gramps source/citation details or error
         """
-        # Check if citation already exists
-        existing = self.db.query(GrampsCitation).filter(
-            and_(
-                GrampsCitation.gramps_person_id == gramps_person_id,
-                GrampsCitation.obituary_cache_id == obituary_cache_id
-            )
-        ).first()
-
-        if existing:
-            return {
-                'skipped': True,
-                'reason': 'Citation already exists',
-                'citation_id': existing.id
-            }
-
-        # Get obituary
-        obituary = self.db.query(ObituaryCache).filter(
-            ObituaryCache.id == obituary_cache_id
-        ).first()
-
-        if not obituary:
+        if not obituary_url:
             return {'success': False, 'error': 'Obituary not found'}
 
-        # Get the deceased primary person name from facts
-        primary_fact = self.db.query(ExtractedFact).filter(
-            and_(
-                ExtractedFact.obituary_cache_id == obituary_cache_id,
-                ExtractedFact.subject_role == 'deceased_primary',
-                ExtractedFact.fact_type == 'person_name'
-            )
-        ).first()
-
-        deceased_name = primary_fact.fact_value if primary_fact else "Unknown"
-
-        # Create or find source in Gramps
-        source_title = f"Obituary of {deceased_name}"
-        source_result = self.gramps.find_or_create_source(
-            title=source_title,
-            url=obituary.url,
-            author=None,
-            pubinfo=None
-        )
-
-        if not source_result:
+        if not source:
             return {'success': False, 'error': 'Failed to create source in Gramps'}
 
-        gramps_source_id, source_handle = source_result
+        gramps_source_id, source_handle = source
 
         # Create citation in Gramps
         citation_note = f"Extracted from obituary: {deceased_name}"
 
         gramps_confidence = self.CONFIDENCE_MAP.get(confidence, 2)
 
-        gramps_citation = self.gramps.create_citation(
-            source_handle=source_handle,
-            page=obituary.url,
-            confidence=gramps_confidence,
-            note=citation_note
-        )
+        try:
+            gramps_citation = self.gramps.create_citation(
+                source_handle=source_handle,
+                page=obituary_url,
+                confidence=gramps_confidence,
+                note=citation_note
+            )
+        except Exception as e:
+            return {'success': False, 'error': f'Failed to create citation in Gramps: {e}'}
 
         if not gramps_citation:
             return {'success': False, 'error': 'Failed to create citation in Gramps'}
 
-        gramps_citation_id = gramps_citation.get('gramps_id')
-        citation_handle = gramps_citation.get('handle')
-
-        # Add citation to person in Gramps
-        if citation_handle:
-            self.gramps.add_citation_to_person(
-                person_handle=gramps_handle,
-                citation_handle=citation_handle
-            )
-
-        # Record in our database (with denormalized obituary_name for audit trail)
-        local_citation = GrampsCitation(
-            obituary_cache_id=obituary_cache_id,
-            person_cluster_id=cluster_id,
-            gramps_person_id=gramps_person_id,
-            gramps_source_id=gramps_source_id,
-            gramps_citation_id=gramps_citation_id,
-            citation_type='obituary',
-            obituary_name=f"Obituary of {deceased_name}",
-            confidence=confidence
-        )
-
-        self.db.add(local_citation)
-
         return {
             'success': True,
-            'obituary_id': obituary_cache_id,
+            'deceased_name': deceased_name,
             'gramps_source_id': gramps_source_id,
-            'gramps_citation_id': gramps_citation_id,
-            'local_citation_id': local_citation.id if local_citation.id else 'pending'
+            'gramps_citation_id': gramps_citation.get('gramps_id'),
+            'citation_handle': gramps_citation.get('handle')
         }
 
     def get_cluster_citations(self, cluster_id: int) -> List[Dict]:
@@ -236,34 +281,35 @@ class CitationService:
         Returns:
             List of citation records
         """
-        citations = self.db.query(GrampsCitation).filter(
+        # Obituary URLs come back in the same query via a join
+        citations = self.db.query(GrampsCitation).options(
+            joinedload(GrampsCitation.obituary).load_only(ObituaryCache.url)
+        ).filter(
             GrampsCitation.person_cluster_id == cluster_id
         ).all()
 
+        # Deceased names for legacy records, looked up together
+        legacy_names = self._legacy_obituary_names({
+            citation.obituary_cache_id
+            for citation in citations
+            if not citation.obituary_name and citation.obituary
+        })
+
         result = []
         for citation in citations:
-            # Get obituary URL
-            obituary = self.db.query(ObituaryCache).filter(
-                ObituaryCache.id == citation.obituary_cache_id
-            ).first()
+            obituary_url = citation.obituary.url if citation.obituary else None
 
             # Use denormalized obituary_name, fallback to lookup for legacy records
             obituary_name = citation.obituary_name
-            if not obituary_name and obituary:
-                primary_fact = self.db.query(ExtractedFact).filter(
-                    and_(
-                        ExtractedFact.obituary_cache_id == obituary.id,
-                        ExtractedFact.subject_role == 'deceased_primary',
-                        ExtractedFact.fact_type == 'person_name'
-                    )
-                ).first()
+            if not obituary_name and obituary_url:
+                primary_fact = legacy_names.get(citation.obituary_cache_id)
                 obituary_name = f"Obituary of {primary_fact.fact_value}" if primary_fact else None
 
             result.append({
                 'id': citation.id,
                 'obituary_cache_id': citation.obituary_cache_id,
                 'obituary_name': obituary_name,
-                'obituary_url': obituary.url if obituary else None,
+                'obituary_url': obituary_url,
                 'gramps_person_id': citation.gramps_person_id,
                 'gramps_source_id': citation.gramps_source_id,
                 'gramps_citation_id': citation.gramps_citation_id,
@@ -284,33 +330,35 @@ class CitationService:
         Returns:
             List of citation records
         """
-        citations = self.db.query(GrampsCitation).filter(
+        # Obituary URLs come back in the same query via a join
+        citations = self.db.query(GrampsCitation).options(
+            joinedload(GrampsCitation.obituary).load_only(ObituaryCache.url)
+        ).filter(
             GrampsCitation.gramps_person_id == gramps_person_id
         ).all()
 
+        # Deceased names for legacy records, looked up together
+        legacy_names = self._legacy_obituary_names({
+            citation.obituary_cache_id
+            for citation in citations
+            if not citation.obituary_name and citation.obituary
+        })
+
         result = []
         for citation in citations:
-            obituary = self.db.query(ObituaryCache).filter(
-                ObituaryCache.id == citation.obituary_cache_id
-            ).first()
+            obituary_url = citation.obituary.url if citation.obituary else None
 
             # Use denormalized obituary_name, fallback to lookup for legacy records
             obituary_name = citation.obituary_name
-            if not obituary_name and obituary:
-                primary_fact = self.db.query(ExtractedFact).filter(
-                    and_(
-                        ExtractedFact.obituary_cache_id == obituary.id,
-                        ExtractedFact.subject_role == 'deceased_primary',
-                        ExtractedFact.fact_type == 'person_name'
-                    )
-                ).first()
+            if not obituary_name and obituary_url:
+                primary_fact = legacy_names.get(citation.obituary_cache_id)
                 obituary_name = f"Obituary of {primary_fact.fact_value}" if primary_fact else None
 
             result.append({
                 'id': citation.id,
                 'obituary_cache_id': citation.obituary_cache_id,
                 'obituary_name': obituary_name,
-                'obituary_url': obituary.url if obituary else None,
+                'obituary_url': obituary_url,
                 'cluster_id': citation.person_cluster_id,
                 'gramps_source_id': citation.gramps_source_id,
                 'gramps_citation_id': citation.gramps_citation_id,
@@ -331,7 +379,8 @@ class CitationService:
         Returns:
             Dict with results
         """
-        cluster = self.db.query(PersonCluster).filter(
+        # Only the current Gramps ID is needed from the cluster row
+        cluster = self.db.query(PersonCluster.gramps_person_id).filter(
             PersonCluster.id == cluster_id
         ).first()
 
@@ -341,8 +390,12 @@ class CitationService:
         old_gramps_id = cluster.gramps_person_id
 
         # Clear Gramps ID from cluster
-        cluster.gramps_person_id = None
-        cluster.cluster_status = 'unverified'
+        self.db.query(PersonCluster).filter(
+            PersonCluster.id == cluster_id
+        ).update({
+            'gramps_person_id': None,
+            'cluster_status': 'unverified'
+        })
 
         # Clear from facts
         self.db.query(ExtractedFact).filter(
@@ -376,44 +429,32 @@ class CitationService:
         Returns:
             List of citation records ordered by creation date (newest first)
         """
-        citations = self.db.query(GrampsCitation).order_by(
+        # Cluster names and obituary existence come back in the same query
+        citations = self.db.query(GrampsCitation).options(
+            joinedload(GrampsCitation.person_cluster).load_only(PersonCluster.canonical_name),
+            joinedload(GrampsCitation.obituary).load_only(ObituaryCache.id)
+        ).order_by(
             GrampsCitation.created_timestamp.desc()
         ).limit(limit).all()
 
+        # Obituary names for legacy records, looked up together
+        legacy_names = self._legacy_obituary_names({
+            citation.obituary_cache_id
+            for citation in citations
+            if not citation.obituary_name and citation.obituary
+        }, deceased_only=False)
+
         result = []
         for citation in citations:
             # Get cluster name if available
-            cluster_name = None
-            if citation.person_cluster_id:
-                cluster = self.db.query(PersonCluster).filter(
-                    PersonCluster.id == citation.person_cluster_id
-                ).first()
-                cluster_name = cluster.canonical_name if cluster else None
+            cluster = citation.person_cluster if citation.person_cluster_id else None
+            cluster_name = cluster.canonical_name if cluster else None
 
             # Use denormalized obituary_name, fallback to lookup for legacy records
             obituary_name = citation.obituary_name
             if not obituary_name:
-                obituary = self.db.query(ObituaryCache).filter(
-                    ObituaryCache.id == citation.obituary_cache_id
-                ).first()
-                if obituary:
-                    # Try deceased_primary first
-                    primary_fact = self.db.query(ExtractedFact).filter(
-                        and_(
-                            ExtractedFact.obituary_cache_id == obituary.id,
-                            ExtractedFact.subject_role == 'deceased_primary',
-                            ExtractedFact.fact_type == 'person_name'
-                        )
-                    ).first()
-                    # Fallback to first person_name fact
-                    if not primary_fact:
-                        primary_fact = self.db.query(ExtractedFact).filter(
-                            and_(
-                                ExtractedFact.obituary_cache_id == obituary.id,
-                                ExtractedFact.fact_type == 'person_name'
-                            )
-                        ).first()
-                    obituary_name = f"Obituary of {primary_fact.subject_name}" if primary_fact else None
+                primary_fact = legacy_names.get(citation.obituary_cache_id)
+                obituary_name = f"Obituary of {primary_fact.subject_name}" if primary_fact else None
 
             result.append({
                 'id': citation.id,
@@ -428,3 +469,43 @@ class CitationService:
             })
 
         return result
+
+    def _legacy_obituary_names(self, obituary_ids: Set[int], deceased_only: bool = True) -> Dict:
+        """
+        First person_name fact per obituary, for citations recorded before
+        obituary_name was stored on them.
+
+        Args:
+            obituary_ids: Obituary IDs to look up
+            deceased_only: Only use the deceased_primary person; otherwise
+                prefer it and fall back to the first person_name fact
+
+        Returns:
+            Dict of obituary ID to row with subject_name and fact_value
+        """
+        if not obituary_ids:
+            return {}
+
+        conditions = [
+            ExtractedFact.obituary_cache_id.in_(obituary_ids),
+            ExtractedFact.fact_type == 'person_name'
+        ]
+        if deceased_only:
+            conditions.append(ExtractedFact.subject_role == 'deceased_primary')
+
+        rows = self.db.query(
+            ExtractedFact.obituary_cache_id,
+            ExtractedFact.subject_name,
+            ExtractedFact.fact_value
+        ).filter(
+            and_(*conditions)
+        ).order_by(
+            ExtractedFact.obituary_cache_id,
+            case((ExtractedFact.subject_role == 'deceased_primary', 0), else_=1),
+            ExtractedFact.id
+        )
+
+        names = {}
+        for row in rows:
+            names.setdefault(row.obituary_cache_id, row)
+        return names
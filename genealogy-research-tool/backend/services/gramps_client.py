@@ -7,9 +7,28 @@ Future stages will add write capabilities.
 
 import os
 import requests
-from typing import List, Dict, Optional, Any
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Dict, Optional, Any, Tuple
 from datetime import datetime
 
+# Concurrent Gramps Web requests per client (event/family GETs, citation
+# writes); each is a small request that only waits on the network
+GRAMPS_FETCH_WORKERS = 8
+
+
+def _char_mask(text: str) -> int:
+    """
+    64-bit signature of the characters in text (bit ord(c) % 64 per char).
+
+    If a is a substring of b, every bit of a's mask is set in b's mask,
+    so a missing bit proves a can't occur in b.
+    """
+    mask = 0
+    for char in text:
+        mask |= 1 << (ord(char) % 64)
+    return mask
+
 
 class GrampsClient:
     """
@@ -28,11 +47,34 @@ class GrampsClient:
         # Remove trailing slash
         self.base_url = self.base_url.rstrip('/')
 
+        # People list for search_people, loaded on first search
+        self._people: Optional[List[Dict]] = None
+        self._people_given: List[str] = []
+        self._people_surnames: List[str] = []
+        self._people_full_names: List[str] = []
+        self._surnames_mask = 0
+
+        # Events fetched by get_events, by handle
+        self._events: Dict[str, Dict] = {}
+
+        # People fetched by get_person, by the handle or ID asked for
+        self._persons: Dict[str, Dict] = {}
+
+        # One session for every request, with a connection pool as large
+        # as the worker pool so each worker keeps its connection alive
+        # from one batch to the next
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=GRAMPS_FETCH_WORKERS)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'Content-Type': 'application/json'
         })
 
+        # Worker threads for concurrent requests, started on first use and
+        # kept for the life of the client
+        self._executor = ThreadPoolExecutor(max_workers=GRAMPS_FETCH_WORKERS)
+
         # Try to authenticate if we have credentials
         if not self.api_token and self.username and self.password:
             self._authenticate()
@@ -41,6 +83,26 @@ class GrampsClient:
                 'Authorization': f'Bearer {self.api_token}'
             })
 
+    def close(self):
+        """Stop the worker threads and close the HTTP connections"""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def map_concurrently(self, func: Callable, items: Iterable) -> List:
+        """
+        Call func on each item using the client's worker threads.
+
+        Returns:
+            Results in the order of items
+        """
+        return list(self._executor.map(func, items))
+
     def _authenticate(self) -> bool:
         """
         Authenticate with Gramps Web using username/password to get JWT token.
@@ -126,39 +188,31 @@ class GrampsClient:
         Returns:
             List of person objects
         """
-        # Fetch all people (Gramps Web API doesn't support name filtering)
-        params = {'pagesize': 1000}  # Get all people
-
         try:
-            # Gramps Web search endpoint
-            response = self._request('GET', '/people/', params=params)
-
-            # Handle different response formats
-            if isinstance(response, list):
-                people = response
-            elif isinstance(response, dict) and 'data' in response:
-                people = response['data']
-            else:
+            if not self._load_people():
+                return []
+
+            given_filter = given_name.lower() if given_name else None
+            surname_filter = surname.lower() if surname else None
+            query_filter = query.lower() if query else None
+
+            # A surname using a character no loaded surname has can't match
+            # anyone, so skip the scan over every person
+            if surname_filter and _char_mask(surname_filter) & ~self._surnames_mask:
                 return []
 
             # Client-side filtering (Gramps Web doesn't support server-side name filtering)
             results = []
-            for person in people:
-                primary_name = person.get('primary_name', {})
-                person_given = primary_name.get('first_name', '').lower()
-                surname_list = primary_name.get('surname_list', [])
-                person_surname = surname_list[0].get('surname', '').lower() if surname_list else ''
-                full_name = f"{person_given} {person_surname}"
-
+            for i, person_given in enumerate(self._people_given):
                 # Apply filters
-                if given_name and given_name.lower() not in person_given:
+                if given_filter and given_filter not in person_given:
                     continue
-                if surname and surname.lower() not in person_surname:
+                if surname_filter and surname_filter not in self._people_surnames[i]:
                     continue
-                if query and query.lower() not in full_name:
+                if query_filter and query_filter not in self._people_full_names[i]:
                     continue
 
-                results.append(person)
+                results.append(self._people[i])
 
                 if len(results) >= limit:
                     break
@@ -168,21 +222,139 @@ class GrampsClient:
             print(f"Search failed: {e}")
             return []
 
+    def search_people_by_names(
+        self,
+        names: List[Tuple[str, str]],
+        limit: int = 10
+    ) -> List[List[Dict]]:
+        """
+        Run several given name/surname searches in one pass over the people.
+
+        Searches sharing a surname check each person's surname once rather
+        than once per search, and the scan stops as soon as every search
+        has its limit of results.
+
+        Args:
+            names: (given_name, surname) pairs, as passed to search_people
+            limit: Maximum results per search
+
+        Returns:
+            Results for each pair, the same as search_people would return
+        """
+        results = [[] for _ in names]
+        try:
+            if not self._load_people():
+                return results
+
+            # Open searches grouped by surname filter: surname -> [(index, given)]
+            pending = {}
+            for index, (given_name, surname) in enumerate(names):
+                surname_filter = surname.lower() if surname else None
+                # A surname using a character no loaded surname has can't match
+                if surname_filter and _char_mask(surname_filter) & ~self._surnames_mask:
+                    continue
+                given_filter = given_name.lower() if given_name else None
+                pending.setdefault(surname_filter, []).append((index, given_filter))
+
+            for i, person_given in enumerate(self._people_given):
+                if not pending:
+                    break
+
+                person_surname = self._people_surnames[i]
+                for surname_filter in list(pending):
+                    if surname_filter and surname_filter not in person_surname:
+                        continue
+
+                    searches = pending[surname_filter]
+                    for search in list(searches):
+                        index, given_filter = search
+                        if given_filter and given_filter not in person_given:
+                            continue
+
+                        results[index].append(self._people[i])
+                        if len(results[index]) >= limit:
+                            searches.remove(search)
+
+                    if not searches:
+                        del pending[surname_filter]
+
+            return results
+        except Exception as e:
+            print(f"Search failed: {e}")
+            return [[] for _ in names]
+
+    def _load_people(self) -> bool:
+        """
+        Fetch all people once per client and index their names for search.
+
+        Names are kept lowercased in lists parallel to self._people, so
+        repeated searches (one per name variant when matching a cluster)
+        neither refetch the people list nor rebuild names per person.
+
+        Returns:
+            True if the people list is loaded
+        """
+        if self._people is not None:
+            return True
+
+        # Fetch all people (Gramps Web API doesn't support name filtering)
+        params = {'pagesize': 1000}  # Get all people
+
+        # Gramps Web search endpoint
+        response = self._request('GET', '/people/', params=params)
+
+        # Handle different response formats
+        if isinstance(response, list):
+            people = response
+        elif isinstance(response, dict) and 'data' in response:
+            people = response['data']
+        else:
+            return False
+
+        people_given = []
+        people_surnames = []
+        people_full_names = []
+        surnames_mask = 0
+        for person in people:
+            primary_name = person.get('primary_name', {})
+            person_given = primary_name.get('first_name', '').lower()
+            surname_list = primary_name.get('surname_list', [])
+            person_surname = surname_list[0].get('surname', '').lower() if surname_list else ''
+
+            people_given.append(person_given)
+            people_surnames.append(person_surname)
+            people_full_names.append(f"{person_given} {person_surname}")
+            surnames_mask |= _char_mask(person_surname)
+
+        self._people = people
+        self._people_given = people_given
+        self._people_surnames = people_surnames
+        self._people_full_names = people_full_names
+        self._surnames_mask = surnames_mask
+        return True
+
     def get_person(self, identifier: str) -> Optional[Dict]:
         """
         Get a specific person by handle or Gramps ID.
 
+        People are kept per client, so asking for the same person again
+        (e.g. for their events and then their families) doesn't refetch.
+
         Args:
             identifier: Gramps handle or person ID
 
         Returns:
             Person object or None if not found
         """
-        try:
-            # Try as handle first (Gramps Web API uses handles)
-            return self._request('GET', f'/people/{identifier}')
-        except:
-            return None
+        person = self._persons.get(identifier)
+        if person is None:
+            try:
+                # Try as handle first (Gramps Web API uses handles)
+                person = self._request('GET', f'/people/{identifier}')
+            except:
+                return None
+            self._persons[identifier] = person
+        return person
 
     def get_person_events(self, handle: str) -> List[Dict]:
         """
@@ -203,12 +375,17 @@ class GrampsClient:
         except:
             return []
 
-    def get_person_events_from_person(self, person: Dict) -> List[Dict]:
+    def get_person_events_from_person(
+        self,
+        person: Dict,
+        events_by_handle: Optional[Dict[str, Dict]] = None
+    ) -> List[Dict]:
         """
         Get all events from a person object (avoids extra API call).
 
         Args:
             person: Gramps person object
+            events_by_handle: Events already fetched with get_events
 
         Returns:
             List of event objects
@@ -217,21 +394,55 @@ class GrampsClient:
             if not person or 'event_ref_list' not in person:
                 return []
 
-            events = []
-            for event_ref in person.get('event_ref_list', []):
-                event_id = event_ref.get('ref')
-                if event_id:
-                    try:
-                        event = self._request('GET', f'/events/{event_id}')
-                        if event:
-                            events.append(event)
-                    except:
-                        pass  # Skip if event fetch fails
-
-            return events
+            # One lookup per ref and per event (stored events are never empty)
+            event_ids = [
+                event_id for event_id in (
+                    event_ref.get('ref') for event_ref in person.get('event_ref_list', [])
+                )
+                if event_id
+            ]
+            if events_by_handle is None:
+                events_by_handle = self.get_events(event_ids)
+
+            events = (events_by_handle.get(event_id) for event_id in event_ids)
+            return [event for event in events if event]
         except:
             return []
 
+    def get_events(self, handles: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch events concurrently.
+
+        Events are kept per client, so handles shared between people, or
+        seen by an earlier call, are only requested once.
+
+        Args:
+            handles: Gramps event handles
+
+        Returns:
+            Dict of handle -> event object (failed fetches are left out)
+        """
+        def fetch(event_id):
+            try:
+                return self._request('GET', f'/events/{event_id}')
+            except:
+                return None  # Skip if event fetch fails
+
+        unique_handles = list(dict.fromkeys(handles))
+        missing_handles = [event_id for event_id in unique_handles if event_id not in self._events]
+        if missing_handles:
+            fetched = self.map_concurrently(fetch, missing_handles)
+            for event_id, event in zip(missing_handles, fetched):
+                if event:
+                    self._events[event_id] = event
+
+        events = {}
+        for event_id in unique_handles:
+            event = self._events.get(event_id)
+            if event:
+                events[event_id] = event
+        return events
+
     def get_person_families(self, gramps_id: str) -> Dict[str, List[Dict]]:
         """
         Get all families for a person (as parent and as child).
@@ -247,34 +458,44 @@ class GrampsClient:
             if not person:
                 return {'as_parent': [], 'as_child': []}
 
-            families = {'as_parent': [], 'as_child': []}
-
-            # Families where person is parent
-            for family_ref in person.get('parent_family_list', []):
-                family_id = family_ref.get('ref') if isinstance(family_ref, dict) else family_ref
-                if family_id:
-                    family = self._request('GET', f'/families/{family_id}')
-                    if family:
-                        families['as_parent'].append(family)
-
-            # Families where person is child
-            for family_ref in person.get('child_ref_list', []):
-                family_id = family_ref.get('ref') if isinstance(family_ref, dict) else family_ref
-                if family_id:
-                    family = self._request('GET', f'/families/{family_id}')
-                    if family:
-                        families['as_child'].append(family)
-
-            return families
+            def family_ids(family_refs):
+                return [
+                    family_id for family_id in (
+                        family_ref.get('ref') if isinstance(family_ref, dict) else family_ref
+                        for family_ref in family_refs
+                    )
+                    if family_id
+                ]
+
+            # Families where person is parent / child
+            parent_ids = family_ids(person.get('parent_family_list', []))
+            child_ids = family_ids(person.get('child_ref_list', []))
+
+            # Fetch both lists' families concurrently, each handle once
+            unique_ids = list(dict.fromkeys(parent_ids + child_ids))
+            fetched = dict(zip(unique_ids, self.map_concurrently(
+                lambda family_id: self._request('GET', f'/families/{family_id}'),
+                unique_ids
+            )))
+
+            return {
+                'as_parent': [fetched[family_id] for family_id in parent_ids if fetched[family_id]],
+                'as_child': [fetched[family_id] for family_id in child_ids if fetched[family_id]]
+            }
         except:
             return {'as_parent': [], 'as_child': []}
 
-    def extract_person_facts(self, person: Dict) -> Dict[str, Any]:
+    def extract_person_facts(
+        self,
+        person: Dict,
+        events_by_handle: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, Any]:
         """
         Extract key facts from a Gramps person object for comparison.
 
         Args:
             person: Gramps person object
+            events_by_handle: Events already fetched with get_events
 
         Returns:
             Dict of extracted facts (name, dates, relationships, etc.)
@@ -290,45 +511,37 @@ class GrampsClient:
             'death_place': None
         }
 
-        # Extract names
+        # Extract names (primary first, then alternates)
         primary_name = person.get('primary_name', {})
-        if primary_name:
-            facts['names'].append({
-                'type': 'primary',
-                'given': primary_name.get('first_name', ''),
-                'surname': primary_name.get('surname_list', [{}])[0].get('surname', ''),
-                'full': f"{primary_name.get('first_name', '')} {primary_name.get('surname_list', [{}])[0].get('surname', '')}".strip()
-            })
+        name_entries = [('primary', primary_name)] if primary_name else []
+        name_entries.extend(('alternate', alt_name) for alt_name in person.get('alternate_names', []))
 
-        # Alternative names
-        for alt_name in person.get('alternate_names', []):
+        for name_type, name in name_entries:
+            given = name.get('first_name', '')
+            surname = name.get('surname_list', [{}])[0].get('surname', '')
             facts['names'].append({
-                'type': 'alternate',
-                'given': alt_name.get('first_name', ''),
-                'surname': alt_name.get('surname_list', [{}])[0].get('surname', ''),
-                'full': f"{alt_name.get('first_name', '')} {alt_name.get('surname_list', [{}])[0].get('surname', '')}".strip()
+                'type': name_type,
+                'given': given,
+                'surname': surname,
+                'full': f"{given} {surname}".strip()
             })
 
         # Extract birth/death from events (use handle, not gramps_id)
-        events = self.get_person_events_from_person(person)
+        events = self.get_person_events_from_person(person, events_by_handle)
         for event in events:
             event_type = event.get('type', {}).get('string', '') if isinstance(event.get('type'), dict) else event.get('type', '')
 
-            if event_type.lower() == 'birth':
-                date = event.get('date')
-                if date:
-                    facts['birth_date'] = self._format_gramps_date(date)
-                place_handle = event.get('place')
-                if place_handle:
-                    facts['birth_place'] = place_handle
-
-            elif event_type.lower() == 'death':
-                date = event.get('date')
-                if date:
-                    facts['death_date'] = self._format_gramps_date(date)
-                place_handle = event.get('place')
-                if place_handle:
-                    facts['death_place'] = place_handle
+            # Event type strings map straight onto the fact keys
+            kind = event_type.lower()
+            if kind not in ('birth', 'death'):
+                continue
+
+            date = event.get('date')
+            if date:
+                facts[f'{kind}_date'] = self._format_gramps_date(date)
+            place_handle = event.get('place')
+            if place_handle:
+                facts[f'{kind}_place'] = place_handle
 
         return facts
 
@@ -455,17 +668,20 @@ class GrampsClient:
             print(f"Failed to create citation: {e}")
             return None
 
-    def add_citation_to_person(
+    def add_citations_to_person(
         self,
         person_handle: str,
-        citation_handle: str
+        citation_handles: List[str]
     ) -> bool:
         """
-        Add a citation to a person record.
+        Add several citations to a person record with a single update.
+
+        The person kept by get_person is updated in place, so it stays
+        current for later calls.
 
         Args:
             person_handle: Gramps person handle
-            citation_handle: Gramps citation handle
+            citation_handles: Gramps citation handles
 
         Returns:
             True if successful
@@ -477,15 +693,16 @@ class GrampsClient:
                 return False
 
             # Get citation list
-            citation_list = person.get('citation_list', [])
+            citation_list = person.setdefault('citation_list', [])
 
-            # Check if citation already exists
-            if citation_handle in citation_list:
+            # Skip citations that already exist
+            new_handles = [h for h in dict.fromkeys(citation_handles) if h not in citation_list]
+            if not new_handles:
                 print(f"Citation already exists on person")
                 return True
 
-            # Add citation
-            citation_list.append(citation_handle)
+            # Add citations
+            citation_list.extend(new_handles)
 
             # Update person
             update_data = {'citation_list': citation_list}
@@ -494,14 +711,56 @@ class GrampsClient:
             return True
         except Exception as e:
             print(f"Failed to add citation to person: {e}")
+            # The kept person may now list citations Gramps doesn't have
+            self._persons.pop(person_handle, None)
             return False
 
+    def get_source_index(self) -> Optional[Dict[str, tuple]]:
+        """
+        Fetch all sources once and index them by their URL attribute.
+
+        Returns:
+            Dict of URL to (gramps_id, handle), keeping the first source
+            for each URL, or None if the sources couldn't be fetched
+        """
+        try:
+            # Get all sources and search locally (API may not support search params)
+            sources = self._request('GET', '/sources/')
+        except Exception as e:
+            print(f"Failed to fetch sources: {e}")
+            return None
+
+        if isinstance(sources, dict) and 'data' in sources:
+            sources = sources['data']
+
+        # Make sure sources is a list
+        if not isinstance(sources, list):
+            sources = []
+
+        index = {}
+        for source in sources:
+            if not isinstance(source, dict):
+                continue
+            for attr in source.get('attribute_list', []):
+                if not isinstance(attr, dict):
+                    continue
+                attr_type = attr.get('type', {})
+                if isinstance(attr_type, dict):
+                    type_str = attr_type.get('string', '')
+                else:
+                    type_str = str(attr_type)
+                if type_str == 'URL':
+                    index.setdefault(attr.get('value'), (source.get('gramps_id'), source.get('handle')))
+
+        return index
+
     def find_or_create_source(
         self,
         title: str,
         url: str,
         author: str = None,
-        pubinfo: str = None
+        pubinfo: str = None,
+        source_index: Optional[Dict[str, tuple]] = None
     ) -> Optional[tuple]:
         """
         Find existing source by title/URL or create new one.
@@ -511,35 +770,22 @@ class GrampsClient:
             url: Source URL
             author: Author
             pubinfo: Publication info
+            source_index: Result of get_source_index() when creating
+                several sources, so the source list is fetched once;
+                a newly created source is added to it
 
         Returns:
             Tuple of (gramps_id, handle) or None if failed
         """
         try:
-            # Get all sources and search locally (API may not support search params)
-            sources = self._request('GET', '/sources/')
-
-            if isinstance(sources, dict) and 'data' in sources:
-                sources = sources['data']
+            if source_index is None:
+                source_index = self.get_source_index()
+                if source_index is None:
+                    return None
 
-            # Make sure sources is a list
-            if not isinstance(sources, list):
-                sources = []
-
-            # Check if any match our URL
-            for source in sources:
-                if not isinstance(source, dict):
-                    continue
-                for attr in source.get('attribute_list', []):
-                    if not isinstance(attr, dict):
-                        continue
-                    attr_type = attr.get('type', {})
-                    if isinstance(attr_type, dict):
-                        type_str = attr_type.get('string', '')
-                    else:
-                        type_str = str(attr_type)
-                    if type_str == 'URL' and attr.get('value') == url:
-                        return (source.get('gramps_id'), source.get('handle'))
+            # Check if any source has our URL
+            if url in source_index:
+                return source_index[url]
 
             # Not found, create new
             new_source = self.create_source(
@@ -550,7 +796,9 @@ class GrampsClient:
             )
 
             if new_source:
-                return (new_source.get('gramps_id'), new_source.get('handle'))
+                # Indexed so later calls with the same index reuse it
+                source_index[url] = (new_source.get('gramps_id'), new_source.get('handle'))
+                return source_index[url]
 
             return None
         except Exception as e:
@@ -558,3 +806,15 @@ class GrampsClient:
             import traceback
             traceback.print_exc()
             return None
+
+
+def get_gramps_client():
+    """
+    Dependency for FastAPI routes: a client per request, closed afterwards
+    so its worker threads and connections don't outlive the request.
+    """
+    client = GrampsClient()
+    try:
+        yield client
+    finally:
+        client.close()
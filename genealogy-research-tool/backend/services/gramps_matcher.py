@@ -8,15 +8,25 @@ Uses multiple criteria:
 - Location matching
 """
 
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from models import PersonCluster, ExtractedFact
+from services.fact_clusterer import RELATIONSHIP_FACT_TYPES
 from services.gramps_client import GrampsClient
 from services.person_matcher import PersonMatcher
 import json
 
 
+# Single-valued cluster facts, keyed by the cluster_facts field they fill
+CLUSTER_FACT_FIELDS = {
+    'person_death_date': 'death_date',
+    'person_death_age': 'death_age',
+    'person_birth_date': 'birth_date',
+}
+
+
 class GrampsMatcher:
     """
     Matches person clusters to Gramps Web people.
@@ -46,7 +56,15 @@ class GrampsMatcher:
             return []
 
         # Get all facts for this cluster
-        facts = self.db.query(ExtractedFact).filter(
+        facts = self.db.query(ExtractedFact).options(
+            load_only(
+                ExtractedFact.fact_type,
+                ExtractedFact.fact_value,
+                ExtractedFact.related_name,
+                ExtractedFact.relationship_type,
+                ExtractedFact.confidence_score
+            )
+        ).filter(
             ExtractedFact.person_cluster_id == cluster_id
         ).all()
 
@@ -56,51 +74,67 @@ class GrampsMatcher:
         # Search Gramps using name
         name_variants = json.loads(cluster.name_variants)
 
-        potential_matches = []
-        searched_ids = set()  # Avoid duplicate searches
-
+        # Split each variant into given/surname, lowercased once. Search
+        # filters are case-insensitive, so the lowercased pair is both the
+        # search itself and the key that drops variants differing only in
+        # case, whose candidates would already be in
+        search_names = []
+        searched_names = set()
         for name in name_variants:
-            # Split into given/surname
-            parts = name.split()
+            parts = name.lower().split()
             if len(parts) >= 2:
-                given = ' '.join(parts[:-1])
-                surname = parts[-1]
-
-                # Search Gramps
-                gramps_people = self.gramps.search_people(
-                    given_name=given,
-                    surname=surname,
-                    limit=5
-                )
-
-                for gramps_person in gramps_people:
-                    gramps_id = gramps_person.get('gramps_id')
-
-                    if gramps_id in searched_ids:
-                        continue
-                    searched_ids.add(gramps_id)
-
-                    # Extract Gramps facts
-                    gramps_facts = self.gramps.extract_person_facts(gramps_person)
-
-                    # Calculate match score
-                    match_result = self._calculate_match_score(
-                        cluster_facts,
-                        gramps_facts
-                    )
+                search_key = (' '.join(parts[:-1]), parts[-1])
+                if search_key in searched_names:
+                    continue
+                searched_names.add(search_key)
+                search_names.append(search_key)
+
+        # Search Gramps for every variant in one pass over the people
+        candidates = []
+        searched_ids = set()  # Avoid duplicate searches
+        for gramps_people in self.gramps.search_people_by_names(search_names, limit=5):
+            for gramps_person in gramps_people:
+                gramps_id = gramps_person.get('gramps_id')
+
+                if gramps_id in searched_ids:
+                    continue
+                searched_ids.add(gramps_id)
+                candidates.append(gramps_person)
+
+        # Fetch every candidate's events in one concurrent batch, so a
+        # candidate with many events doesn't serialize its own requests
+        event_handles = [
+            event_id
+            for candidate in candidates
+            for event_id in (event_ref.get('ref') for event_ref in candidate.get('event_ref_list') or [])
+            if event_id
+        ]
+        events_by_handle = self.gramps.get_events(event_handles)
+        candidate_facts = [
+            self.gramps.extract_person_facts(candidate, events_by_handle)
+            for candidate in candidates
+        ]
 
-                    if match_result['confidence'] > 0.5:
-                        potential_matches.append({
-                            'gramps_id': gramps_id,
-                            'gramps_person': gramps_person,
-                            'gramps_facts': gramps_facts,
-                            'match_confidence': match_result['confidence'],
-                            'match_reasons': match_result['reasons'],
-                            'conflicts': match_result['conflicts']
-                        })
+        potential_matches = []
+        for gramps_person, gramps_facts in zip(candidates, candidate_facts):
+            # Calculate match score
+            match_result = self._calculate_match_score(
+                cluster_facts,
+                gramps_facts
+            )
+
+            if match_result['confidence'] > 0.5:
+                potential_matches.append({
+                    'gramps_id': gramps_person.get('gramps_id'),
+                    'gramps_person': gramps_person,
+                    'gramps_facts': gramps_facts,
+                    'match_confidence': match_result['confidence'],
+                    'match_reasons': match_result['reasons'],
+                    'conflicts': match_result['conflicts']
+                })
 
         # Sort by confidence
-        potential_matches.sort(key=lambda x: x['match_confidence'], reverse=True)
+        potential_matches.sort(key=itemgetter('match_confidence'), reverse=True)
 
         return potential_matches
 
@@ -124,13 +158,10 @@ class GrampsMatcher:
         }
 
         for fact in facts:
-            if fact.fact_type == 'person_death_date':
-                cluster_facts['death_date'] = fact.fact_value
-            elif fact.fact_type == 'person_death_age':
-                cluster_facts['death_age'] = fact.fact_value
-            elif fact.fact_type == 'person_birth_date':
-                cluster_facts['birth_date'] = fact.fact_value
-            elif fact.fact_type in ['relationship', 'marriage']:
+            field = CLUSTER_FACT_FIELDS.get(fact.fact_type)
+            if field:
+                cluster_facts[field] = fact.fact_value
+            elif fact.fact_type in RELATIONSHIP_FACT_TYPES:
                 cluster_facts['relationships'].append({
                     'type': fact.relationship_type or fact.fact_value,
                     'related_name': fact.related_name,
@@ -214,10 +245,9 @@ class GrampsMatcher:
 
         best_match = {'score': 0, 'matched': False, 'method': 'none'}
 
-        for c_name in cluster_names:
-            for g_name in gramps_names:
-                match_result = self.fuzzy_matcher.match_score(c_name, g_name)
-
+        # Score every variant against all Gramps names in one batch
+        for variant_results in self.fuzzy_matcher.match_score_matrix(cluster_names, gramps_names):
+            for match_result in variant_results:
                 if match_result['confidence'] > best_match['score']:
                     best_match = {
                         'score': match_result['confidence'],
@@ -218,11 +218,15 @@ async def extract_person_mentions(
     obituary_cache_id: int,
     obituary_text: str,
     llm_provider: str = "openai",
-    model_version: str = "gpt-3.5-turbo"
+    model_version: str = "gpt-3.5-turbo",
+    commit: bool = True
 ) -> tuple[List[Dict], int]:
     """
     PASS 1: Extract person mentions from obituary.
 
+    With commit=False the new cache row is only flushed, leaving the
+    commit to the caller.
+
     Returns:
         (list of person dicts, llm_cache_id)
     """
@@ -246,15 +250,18 @@ async def extract_person_mentions(
     start_time = datetime.now()
 
     try:
-        client = openai.OpenAI()
-        response = client.chat.completions.create(
-            model=model_version,
-            messages=[
-                {"role": "system", "content": "You are a genealogy expert extracting person mentions from obituaries."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1
-        )
+        # Async client: awaiting the request frees the event loop, so other
+        # obituaries being processed overlap their LLM latency with this one.
+        # The context manager closes its connection pool afterwards
+        async with openai.AsyncOpenAI() as client:
+            response = await client.chat.completions.create(
+                model=model_version,
+                messages=[
+                    {"role": "system", "content": "You are a genealogy expert extracting person mentions from obituaries."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.1
+            )
 
         end_time = datetime.now()
         duration_ms = int((end_time - start_time).total_seconds() * 1000)
@@ -295,12 +302,14 @@ async def extract_person_mentions(
             duration_ms=duration_ms
         )
         db.add(llm_cache)
-        db.commit()
-        db.refresh(llm_cache)
+        db.flush()
+        llm_cache_id = llm_cache.id
+        if commit:
+            db.commit()
 
         print(f"Extracted {len(persons)} person mentions (${cost_usd:.4f}, {total_tokens} tokens)")
 
-        return persons, llm_cache.id
+        return persons, llm_cache_id
 
     except Exception as e:
         print(f"LLM extraction failed: {e}")
@@ -314,7 +323,8 @@ async def extract_person_mentions(
             api_error=str(e)
         )
         db.add(llm_cache)
-        db.commit()
+        if commit:
+            db.commit()
         raise
 
 
@@ -324,11 +334,15 @@ async def extract_facts_from_obituary(
     obituary_text: str,
     person_mentions: List[Dict],
     llm_provider: str = "openai",
-    model_version: str = "gpt-3.5-turbo"
+    model_version: str = "gpt-3.5-turbo",
+    commit: bool = True
 ) -> List[ExtractedFact]:
     """
     PASS 2: Extract facts about each person.
 
+    With commit=False the new rows are only flushed, leaving the commit
+    to the caller.
+
     Returns:
         List of ExtractedFact objects (already saved to DB)
     """
@@ -361,15 +375,15 @@ async def extract_facts_from_obituary(
         start_time = datetime.now()
 
         try:
-            client = openai.OpenAI()
-            response = client.chat.completions.create(
-                model=model_version,
-                messages=[
-                    {"role": "system", "content": "You are a genealogy expert extracting facts from obituaries."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1
-            )
+            async with openai.AsyncOpenAI() as client:
+                response = await client.chat.completions.create(
+                    model=model_version,
+                    messages=[
+                        {"role": "system", "content": "You are a genealogy expert extracting facts from obituaries."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.1
+                )
 
             end_time = datetime.now()
             duration_ms = int((end_time - start_time).total_seconds() * 1000)
@@ -407,10 +421,10 @@ async def extract_facts_from_obituary(
                 duration_ms=duration_ms
             )
             db.add(llm_cache)
-            db.commit()
-            db.refresh(llm_cache)
-
+            db.flush()
             llm_cache_id = llm_cache.id
+            if commit:
+                db.commit()
 
             print(f"Extracted {len(facts_data)} facts (${cost_usd:.4f}, {total_tokens} tokens)")
 
@@ -425,7 +439,8 @@ async def extract_facts_from_obituary(
                 api_error=str(e)
             )
             db.add(llm_cache)
-            db.commit()
+            if commit:
+                db.commit()
             raise
 
     # Convert to ExtractedFact objects with deduplication
@@ -439,11 +454,18 @@ async def extract_facts_from_obituary(
             print(f"Skipping invalid fact: {fact_data}")
             continue
 
+        # Collapse whitespace as ExtractedFact.validate_name will, so names
+        # that differ only in spacing share a dedup key
+        subject_name = ' '.join(fact_data['subject_name'].split())
+        related_name = fact_data.get('related_name')
+        if related_name is not None:
+            related_name = ' '.join(related_name.split())
+
         # Get fact_value, default to subject_name for person_name facts
         fact_value = fact_data.get('fact_value')
         if not fact_value:
             if fact_data.get('fact_type') == 'person_name':
-                fact_value = fact_data.get('subject_name')
+                fact_value = subject_name
             elif fact_data.get('fact_type') == 'relationship':
                 fact_value = fact_data.get('relationship_type', 'related')
             else:
@@ -452,9 +474,9 @@ async def extract_facts_from_obituary(
         # Create deduplication key from core fact attributes
         dedup_key = (
             fact_data['fact_type'],
-            fact_data['subject_name'],
+            subject_name,
             fact_value,
-            fact_data.get('related_name'),
+            related_name,
             fact_data.get('relationship_type')
         )
 
@@ -469,10 +491,10 @@ async def extract_facts_from_obituary(
             obituary_cache_id=obituary_cache_id,
             llm_cache_id=llm_cache_id,
             fact_type=fact_data['fact_type'],
-            subject_name=fact_data['subject_name'],
+            subject_name=subject_name,
             subject_role=fact_data.get('subject_role', 'other'),
             fact_value=fact_value,
-            related_name=fact_data.get('related_name'),
+            related_name=related_name,
             relationship_type=fact_data.get('relationship_type'),
             extracted_context=fact_data.get('extracted_context'),
             source_sentence=fact_data.get('source_sentence'),
@@ -480,14 +502,17 @@ async def extract_facts_from_obituary(
             inference_basis=fact_data.get('inference_basis'),
             confidence_score=fact_data.get('confidence_score', 0.80)
         )
-        db.add(fact)
         extracted_facts.append(fact)
 
-    db.commit()
+    db.add_all(extracted_facts)
+    db.flush()
+    if commit:
+        fact_ids = [fact.id for fact in extracted_facts]
+        db.commit()
 
-    # Refresh to get IDs
-    for fact in extracted_facts:
-        db.refresh(fact)
+        # Reload committed facts in one query instead of refreshing each
+        if fact_ids:
+            db.query(ExtractedFact).filter(ExtractedFact.id.in_(fact_ids)).all()
 
     print(f"Stored {len(extracted_facts)} unique facts ({duplicates_skipped} duplicates skipped)")
 
@@ -497,22 +522,28 @@ async def extract_facts_from_obituary(
 async def process_obituary_full(
     db: Session,
     obituary_cache_id: int,
-    obituary_text: str
+    obituary_text: str,
+    commit: bool = True
 ) -> Dict:
     """
     Complete multi-pass extraction pipeline.
 
+    With commit=False both passes only flush their rows, so the caller
+    can commit them together with its own changes. That includes the
+    LLMCache row recording a failed call, which is left pending in the
+    session when the exception is raised.
+
     Returns summary of extraction.
     """
 
     # Pass 1: Person mentions
     persons, person_llm_id = await extract_person_mentions(
-        db, obituary_cache_id, obituary_text
+        db, obituary_cache_id, obituary_text, commit=commit
     )
 
     # Pass 2: Facts
     facts = await extract_facts_from_obituary(
-        db, obituary_cache_id, obituary_text, persons
+        db, obituary_cache_id, obituary_text, persons, commit=commit
     )
 
     return {
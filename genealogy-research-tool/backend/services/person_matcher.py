@@ -9,14 +9,90 @@ Handles:
 - Middle initial differences
 """
 
-from typing import List, Dict, Tuple, Optional
-from fuzzywuzzy import fuzz
+from typing import List, Dict, Set, Tuple, Optional, NamedTuple
+from rapidfuzz import fuzz, process, utils
+from rapidfuzz.distance import Levenshtein
 from metaphone import doublemetaphone
+import numpy as np
+from functools import lru_cache
 import json
 import re
 from pathlib import Path
 
 
+# Compiled once at import; normalize_name runs for every name compared
+MIDDLE_INITIAL_PATTERN = re.compile(r'\b[A-Z]\.\s*')
+# Generational suffixes (lowercase, without the optional trailing period)
+NAME_SUFFIXES = frozenset({'jr', 'sr', 'ii', 'iii', 'iv'})
+# Names whose NameParts are shared across matcher instances (each
+# request, clusterer and Gramps matcher builds its own PersonMatcher)
+NAME_PARTS_CACHE_SIZE = 16384
+
+
+def block_partial_ratio(s1: str, s2: str, score_cutoff: float = 0) -> int:
+    """
+    Partial ratio aligned on Levenshtein matching blocks.
+
+    rapidfuzz's partial_ratio searches every alignment and scores short
+    first names inside longer full names noticeably higher than the
+    fuzzywuzzy scorer the thresholds were tuned against ("Amy Blunden"
+    vs "Kathy Blunden" goes from 82 to 90). This keeps the original
+    block-anchored behavior while running on rapidfuzz.
+
+    Scores below score_cutoff are returned as 0, which lets rapidfuzz
+    abandon each alignment as soon as it can't reach the cutoff.
+    """
+    if s1 == s2:
+        return 100
+    if not s1 or not s2:
+        return 0
+
+    if len(s1) <= len(s2):
+        shorter, longer = s1, s2
+    else:
+        shorter, longer = s2, s1
+
+    best = 0.0
+    for block in Levenshtein.opcodes(shorter, longer).as_matching_blocks():
+        long_start = max(block.b - block.a, 0)
+        long_substr = longer[long_start:long_start + len(shorter)]
+        score = fuzz.ratio(shorter, long_substr, score_cutoff=score_cutoff)
+        if score > 99.5:
+            return 100
+        best = max(best, score)
+
+    return round(best)
+
+
+@lru_cache(maxsize=None)
+def read_nickname_file(path: Path) -> Dict[str, List[str]]:
+    """
+    Read a nickname database JSON file.
+
+    Cached so the file is parsed once per process rather than once per
+    PersonMatcher (one is created per clustering or Gramps matching
+    request). The returned dict is shared and must not be modified.
+    """
+    if path.exists():
+        with open(path) as f:
+            return json.load(f)
+    else:
+        print(f"Warning: Nickname database not found at {path}")
+        return {}
+
+
+class NameParts(NamedTuple):
+    """Pre-computed comparison forms of a single name"""
+    normalized: str
+    first: str
+    first_key: str  # lowercased first name, for nickname lookups
+    last: str
+    last_normalized: str
+    last_phonetic: Tuple[str, str]
+    first_phonetic: Tuple[str, str]
+    token_sorted: str
+
+
 class PersonMatcher:
     """
     Multi-level person matching for cross-obituary name resolution.
@@ -25,19 +101,27 @@ class PersonMatcher:
     def __init__(self, fuzzy_threshold: float = 0.85):
         self.fuzzy_threshold = fuzzy_threshold
         self.nickname_db = self._load_nicknames()
+        self._nickname_groups = self._index_nicknames(self.nickname_db)
+        self._name_parts_cache: Dict[str, NameParts] = {}
 
     def _load_nicknames(self) -> Dict[str, List[str]]:
         """Load nickname database from JSON file"""
         nicknames_path = Path(__file__).parent.parent / "data" / "nicknames.json"
+        return read_nickname_file(nicknames_path)
 
-        if nicknames_path.exists():
-            with open(nicknames_path) as f:
-                return json.load(f)
-        else:
-            print(f"Warning: Nickname database not found at {nicknames_path}")
-            return {}
-
-    def normalize_name(self, name: str) -> str:
+    def _index_nicknames(self, nickname_db: Dict[str, List[str]]) -> Dict[str, Set[int]]:
+        """
+        Map each lowercased formal name and nickname to the nickname
+        entries it belongs to, so lookups don't scan the whole database.
+        """
+        groups: Dict[str, Set[int]] = {}
+        for group_id, (formal_name, nicknames) in enumerate(nickname_db.items()):
+            for name in [formal_name, *nicknames]:
+                groups.setdefault(name.lower(), set()).add(group_id)
+        return groups
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
         """
         Normalize name for comparison.
 
@@ -46,19 +130,23 @@ class PersonMatcher:
         - Remove suffixes (Jr, Sr, II, III, IV)
         - Lowercase
         """
-        # Remove middle initials
-        name = re.sub(r'\b[A-Z]\.\s*', '', name)
+        # Remove middle initials (an initial always has a period)
+        if '.' in name:
+            name = MIDDLE_INITIAL_PATTERN.sub('', name)
 
-        # Normalize whitespace
-        name = ' '.join(name.split())
+        # Normalize whitespace, then lowercase (the join trims the ends)
+        parts = name.lower().split()
 
-        # Remove suffixes
-        name = re.sub(r'\s+(Jr|Sr|II|III|IV)\.?$', '', name, flags=re.IGNORECASE)
+        # Remove a trailing suffix word
+        if len(parts) > 1:
+            last = parts[-1][:-1] if parts[-1].endswith('.') else parts[-1]
+            if last in NAME_SUFFIXES:
+                parts.pop()
 
-        # Lowercase
-        return name.lower().strip()
+        return ' '.join(parts)
 
-    def get_phonetic_codes(self, name: str) -> Tuple[str, str]:
+    @staticmethod
+    def get_phonetic_codes(name: str) -> Tuple[str, str]:
         """
         Get Double Metaphone phonetic codes.
         Returns (primary_code, secondary_code)
@@ -74,30 +162,21 @@ class PersonMatcher:
             is_known_nickname("Patricia", "Patsy") -> True
             is_known_nickname("Steven", "Steve") -> True
         """
-        name1_lower = name1.lower()
-        name2_lower = name2.lower()
-
-        # Check both directions
-        for formal_name, nicknames in self.nickname_db.items():
-            nicknames_lower = [n.lower() for n in nicknames]
-            formal_lower = formal_name.lower()
-
-            # Check if one is formal and other is nickname
-            if name1_lower == formal_lower and name2_lower in nicknames_lower:
-                return True
-            if name2_lower == formal_lower and name1_lower in nicknames_lower:
-                return True
-
-            # Check if both are nicknames of same formal name
-            if name1_lower in nicknames_lower and name2_lower in nicknames_lower:
-                return True
-            if (name1_lower == formal_lower or name1_lower in nicknames_lower) and \
-               (name2_lower == formal_lower or name2_lower in nicknames_lower):
-                return True
-
-        return False
-
-    def extract_first_last(self, full_name: str) -> Tuple[str, str]:
+        return self._share_nickname_group(name1.lower(), name2.lower())
+
+    def _share_nickname_group(self, key1: str, key2: str) -> bool:
+        """is_known_nickname for names that are already lowercased"""
+        # Both names must belong to the same entry, either as the formal
+        # name or as one of its nicknames
+        groups1 = self._nickname_groups.get(key1)
+        groups2 = self._nickname_groups.get(key2)
+        if not groups1 or not groups2:
+            return False
+
+        return not groups1.isdisjoint(groups2)
+
+    @staticmethod
+    def extract_first_last(full_name: str) -> Tuple[str, str]:
         """
         Extract first name and last name from full name.
         Returns (first_name, last_name)
@@ -111,6 +190,86 @@ class PersonMatcher:
             # First word is first name, last word is last name
             return (parts[0], parts[-1])
 
+    def name_parts(self, name: str) -> NameParts:
+        """
+        Get the normalized forms of a name used for matching.
+
+        Results are cached per matcher so names compared repeatedly
+        (e.g. when clustering every name against every other) are only
+        normalized once, and in a bounded cache shared by all matchers so
+        names seen by earlier requests aren't normalized again.
+        """
+        parts = self._name_parts_cache.get(name)
+        if parts is None:
+            parts = self._build_name_parts(name)
+            self._name_parts_cache[name] = parts
+        return parts
+
+    @staticmethod
+    @lru_cache(maxsize=NAME_PARTS_CACHE_SIZE)
+    def _build_name_parts(name: str) -> NameParts:
+        """Compute NameParts for a name (depends only on the name)"""
+        first, last = PersonMatcher.extract_first_last(name)
+        return NameParts(
+            normalized=PersonMatcher.normalize_name(name),
+            first=first,
+            first_key=first.lower(),
+            last=last,
+            last_normalized=PersonMatcher.normalize_name(last) if last else '',
+            last_phonetic=PersonMatcher.get_phonetic_codes(last) if last else ('', ''),
+            first_phonetic=PersonMatcher.get_phonetic_codes(first if first else name),
+            # token_sort_ratio's preprocessing, done once per name
+            token_sorted=' '.join(sorted(utils.default_process(name).split()))
+        )
+
+    def surname_block_keys(self, name: str) -> List[Tuple[str, str]]:
+        """
+        Blocking keys a name is indexed under.
+
+        match_score rejects names whose surnames differ unless they are
+        phonetically similar or the whole normalized names are equal, so
+        only names sharing one of those forms can match. Indexing names
+        under these keys lets callers skip comparing names that can never
+        match. Names without a surname get the catch-all ('*', '') key.
+        """
+        parts = self.name_parts(name)
+        if not parts.last:
+            return [('*', '')]
+
+        primary, secondary = parts.last_phonetic
+        return [
+            ('name', parts.normalized),
+            ('surname', parts.last_normalized),
+            ('primary', primary),
+            ('secondary', secondary)
+        ]
+
+    def surname_probe_keys(self, name: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Blocking keys to look up when finding candidates for a name.
+
+        Mirrors the surname check in match_score: the target's primary code
+        may equal a candidate's primary or secondary code, and the target's
+        secondary code may equal a candidate's primary code.
+
+        Returns:
+            List of keys, or None if the name has no surname (it may match
+            any candidate)
+        """
+        parts = self.name_parts(name)
+        if not parts.last:
+            return None
+
+        primary, secondary = parts.last_phonetic
+        return [
+            ('*', ''),
+            ('name', parts.normalized),
+            ('surname', parts.last_normalized),
+            ('primary', primary),
+            ('secondary', primary),
+            ('primary', secondary)
+        ]
+
     def match_score(self, name1: str, name2: str) -> Dict:
         """
         Calculate comprehensive match score between two names.
@@ -123,9 +282,99 @@ class PersonMatcher:
                 'details': dict
             }
         """
+        return self._match_score(name1, name2)
+
+    def _fuzzy_scores(
+        self,
+        parts1: NameParts,
+        parts2: NameParts,
+        name1: str,
+        name2: str
+    ) -> Tuple[int, int, int]:
+        """
+        Calculate (ratio, token_sort, partial) fuzzy scores for a single pair.
+
+        Scores are rounded to whole numbers so thresholds stay calibrated
+        against the integer scores the matcher was tuned with.
+        """
+        ratio = fuzz.ratio(parts1.normalized, parts2.normalized)
+        # Equivalent to token_sort_ratio with default_process
+        token_sort = fuzz.ratio(parts1.token_sorted, parts2.token_sorted)
+        partial = block_partial_ratio(name1, name2)
+        return (round(ratio), round(token_sort), partial)
+
+    def _batch_fuzzy_scores(
+        self,
+        target_names: List[str],
+        candidate_names: List[str],
+        target_parts: List[NameParts],
+        candidate_parts: List[NameParts],
+        score_cutoff: float = 0
+    ) -> List[List[Tuple[int, int, int]]]:
+        """
+        Calculate (ratio, token_sort, partial) fuzzy scores for every
+        target against every candidate at once.
+
+        Uses rapidfuzz.process.cdist so the ratio and token_sort scorers run
+        over the whole targets x candidates matrix in native code instead
+        of one Python call per pair.
+
+        With score_cutoff, a partial ratio that can't lift the pair to the
+        cutoff is reported as 0 instead of being calculated exactly.
+
+        Returns:
+            One row of scores per target, in candidate order
+        """
+        if not target_names or not candidate_names:
+            return [[] for _ in target_names]
+
+        ratios = process.cdist(
+            [t.normalized for t in target_parts], [c.normalized for c in candidate_parts],
+            scorer=fuzz.ratio, dtype=np.float64
+        )
+        # Token-sorted forms are cached, so plain ratio gives token_sort_ratio
+        # without re-processing and re-sorting both names for every pair
+        token_sorts = process.cdist(
+            [t.token_sorted for t in target_parts], [c.token_sorted for c in candidate_parts],
+            scorer=fuzz.ratio, dtype=np.float64
+        )
+        rows = []
+        for target_name, target_ratios, target_token_sorts in zip(
+            target_names, ratios.tolist(), token_sorts.tolist()
+        ):
+            scores = []
+            for r, t, candidate in zip(target_ratios, target_token_sorts, candidate_names):
+                r, t = round(r), round(t)
+                # Partial ratio stays per-pair; see block_partial_ratio. It
+                # only needs an exact value when it could decide the pair
+                # (scores are rounded, hence the half-point allowance)
+                if max(r, t) >= score_cutoff:
+                    p = block_partial_ratio(target_name, candidate)
+                else:
+                    p = block_partial_ratio(target_name, candidate, score_cutoff - 0.5)
+                scores.append((r, t, p))
+            rows.append(scores)
+
+        return rows
+
+    def _match_score(
+        self,
+        name1: str,
+        name2: str,
+        fuzzy_scores: Optional[Tuple[int, int, int]] = None
+    ) -> Dict:
+        """
+        Match score implementation.
+
+        fuzzy_scores may be supplied pre-computed (see _batch_fuzzy_scores);
+        otherwise they are calculated for this pair only when needed.
+        """
+        parts1 = self.name_parts(name1)
+        parts2 = self.name_parts(name2)
+
         # Exact match after normalization
-        norm1 = self.normalize_name(name1)
-        norm2 = self.normalize_name(name2)
+        norm1 = parts1.normalized
+        norm2 = parts2.normalized
 
         if norm1 == norm2:
             return {
@@ -138,17 +387,15 @@ class PersonMatcher:
             }
 
         # Extract first and last names
-        first1, last1 = self.extract_first_last(name1)
-        first2, last2 = self.extract_first_last(name2)
+        first1, last1 = parts1.first, parts1.last
+        first2, last2 = parts2.first, parts2.last
 
         # Different surnames = not a match (unless one is empty)
         if last1 and last2:
-            last1_norm = self.normalize_name(last1)
-            last2_norm = self.normalize_name(last2)
-            if last1_norm != last2_norm:
+            if parts1.last_normalized != parts2.last_normalized:
                 # Check if surnames are phonetically similar (e.g., typos)
-                phone_last1 = self.get_phonetic_codes(last1)
-                phone_last2 = self.get_phonetic_codes(last2)
+                phone_last1 = parts1.last_phonetic
+                phone_last2 = parts2.last_phonetic
                 surnames_phonetically_similar = (
                     phone_last1[0] == phone_last2[0] or
                     phone_last1[0] == phone_last2[1] or
@@ -166,7 +413,9 @@ class PersonMatcher:
                     }
 
         # Check nickname match
-        if first1 and first2 and self.is_known_nickname(first1, first2):
+        # Lowercased first names come from the cached parts, so pairs
+        # don't re-lowercase both names on every comparison
+        if first1 and first2 and self._share_nickname_group(parts1.first_key, parts2.first_key):
             return {
                 'score': 95,
                 'method': 'known_nickname',
@@ -179,15 +428,29 @@ class PersonMatcher:
             }
 
         # Fuzzy string matching
-        ratio = fuzz.ratio(norm1, norm2)
-        token_sort = fuzz.token_sort_ratio(name1, name2)
-        partial = fuzz.partial_ratio(name1, name2)
+        if fuzzy_scores is None:
+            fuzzy_scores = self._fuzzy_scores(parts1, parts2, name1, name2)
+        ratio, token_sort, partial = fuzzy_scores
 
         fuzzy_score = max(ratio, token_sort, partial)
 
+        # Phonetic agreement only matters at or above one of the accept
+        # cuts below; under both of them the pair can't match, so stop here
+        if fuzzy_score < min(self.fuzzy_threshold * 100, 90):
+            return {
+                'score': fuzzy_score,
+                'method': 'no_match',
+                'confidence': 0.0,
+                'details': {
+                    'ratio': ratio,
+                    'token_sort': token_sort,
+                    'partial': partial
+                }
+            }
+
         # Phonetic matching
-        phone1_primary, phone1_secondary = self.get_phonetic_codes(first1 if first1 else name1)
-        phone2_primary, phone2_secondary = self.get_phonetic_codes(first2 if first2 else name2)
+        phone1_primary, phone1_secondary = parts1.first_phonetic
+        phone2_primary, phone2_secondary = parts2.first_phonetic
 
         phonetic_match = (
             (phone1_primary and phone2_primary and phone1_primary == phone2_primary) or
@@ -235,6 +498,60 @@ class PersonMatcher:
                 }
             }
 
+    def match_scores(
+        self,
+        target_name: str,
+        candidate_names: List[str],
+        score_cutoff: float = 0
+    ) -> List[Dict]:
+        """
+        Calculate match scores between one name and many candidates.
+
+        Equivalent to calling match_score(target_name, candidate) for each
+        candidate, but the fuzzy scores for all candidates are computed in
+        one batch.
+
+        score_cutoff skips exact fuzzy scoring for pairs whose fuzzy score
+        is below it; those come back as no_match with partial reported
+        as 0. Only pass it when such results are discarded.
+
+        Returns:
+            List of match results, in the same order as candidate_names
+        """
+        return self.match_score_matrix([target_name], candidate_names, score_cutoff)[0]
+
+    def match_score_matrix(
+        self,
+        target_names: List[str],
+        candidate_names: List[str],
+        score_cutoff: float = 0
+    ) -> List[List[Dict]]:
+        """
+        Calculate match scores between several names and many candidates.
+
+        Equivalent to calling match_scores(target, candidate_names) for
+        each target, but the fuzzy scores for every pair are computed as
+        one matrix. score_cutoff is as for match_scores.
+
+        Returns:
+            One list of match results per target, in candidate order
+        """
+        # Normalized forms come from the cache
+        target_parts = [self.name_parts(t) for t in target_names]
+        candidate_parts = [self.name_parts(c) for c in candidate_names]
+
+        fuzzy_scores = self._batch_fuzzy_scores(
+            target_names, candidate_names, target_parts, candidate_parts, score_cutoff
+        )
+
+        return [
+            [
+                self._match_score(target_name, candidate, scores)
+                for candidate, scores in zip(candidate_names, row)
+            ]
+            for target_name, row in zip(target_names, fuzzy_scores)
+        ]
+
     def find_potential_matches(
         self,
         target_name: str,
@@ -254,12 +571,14 @@ class PersonMatcher:
         """
         matches = []
 
-        for candidate in candidate_names:
-            if candidate == target_name:
-                continue
+        candidates = [c for c in candidate_names if c != target_name]
 
-            match_result = self.match_score(target_name, candidate)
+        # Any positive min_confidence drops no_match results, and a fuzzy
+        # match needs at least the lower of the two accept cuts
+        score_cutoff = min(self.fuzzy_threshold * 100, 90) if min_confidence > 0 else 0
+        results = self.match_scores(target_name, candidates, score_cutoff)
 
+        for candidate, match_result in zip(candidates, results):
             if match_result['confidence'] >= min_confidence:
                 matches.append((candidate, match_result))
 
@@ -0,0 +1,75 @@
+import pytest
+import sys
+import json
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from models import Base, ObituaryCache, ExtractedFact, PersonCluster
+import services.fact_clusterer as fact_clusterer
+from services.fact_clusterer import FactClusterer, collation_key
+from utils.hash_utils import hash_url
+
+
+@pytest.fixture
+def db_session():
+    """Create test database session"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def test_collation_key_ignores_case_and_accents():
+    """Names the utf8mb4_unicode_ci column treats as equal share a key"""
+    assert collation_key("José García") == collation_key("jose garcia")
+    assert collation_key("ZOË Brontë") == collation_key("Zoe Bronte")
+    assert collation_key("Amy Wurz") != collation_key("Amy Wurtz")
+
+
+def test_create_person_cluster_records_links_facts_to_their_cluster(db_session, monkeypatch):
+    # Small batches so facts are linked across several UPDATEs
+    monkeypatch.setattr(fact_clusterer, 'FACT_LINK_BATCH_SIZE', 3)
+
+    obituary_names = [
+        ["Patricia Blundon", "Ryan Blundon", "Rose Mary Kaczmarowski"],
+        ["Patricia Blundon", "Terrence Kaczmarowski", "Rosemary Kaczmarowski"],
+        ["Megan Wurz", "Ryan Blundon", "Ross Wurz"],
+    ]
+    for i, names in enumerate(obituary_names):
+        url = f"http://test.com/obit{i}"
+        obit = ObituaryCache(url=url, url_hash=hash_url(url), extracted_text="text")
+        db_session.add(obit)
+        db_session.flush()
+        for name in names:
+            for fact_type in ('person_name', 'location_residence'):
+                db_session.add(ExtractedFact(
+                    obituary_cache_id=obit.id,
+                    fact_type=fact_type,
+                    subject_name=name,
+                    fact_value=name if fact_type == 'person_name' else "Milwaukee",
+                    confidence_score=0.9
+                ))
+    db_session.commit()
+
+    clusterer = FactClusterer(db_session)
+    clusters = clusterer.find_cross_obituary_clusters()
+    records = clusterer.create_person_cluster_records(clusters)
+
+    assert len(records) == len(clusters)
+    variants = {
+        cluster.id: set(json.loads(cluster.name_variants))
+        for cluster in db_session.query(PersonCluster)
+    }
+    assert any("Rose Mary Kaczmarowski" in v and "Rosemary Kaczmarowski" in v for v in variants.values())
+
+    facts = db_session.query(ExtractedFact).all()
+    assert len(facts) == 18
+    for fact in facts:
+        assert fact.resolution_status == 'clustered'
+        assert fact.subject_name in variants[fact.person_cluster_id]
@@ -0,0 +1,110 @@
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from models import Base, PersonCluster, ObituaryCache, ExtractedFact, GrampsCitation
+from services.gramps_citation_service import CitationService
+from services.gramps_client import GrampsClient
+from utils.hash_utils import hash_url
+
+
+@pytest.fixture
+def db_session():
+    """Create test database session"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+class FakeGrampsClient(GrampsClient):
+    """GrampsClient answering from memory; citations for failing_urls fail"""
+
+    def __init__(self, failing_urls=()):
+        super().__init__(base_url='http://gramps.test', api_token='test')
+        self.failing_urls = set(failing_urls)
+        self.sources_created = []
+        self.person_updates = []
+        self._lock = threading.Lock()
+
+    def _request(self, method, endpoint, **kwargs):
+        data = kwargs.get('json')
+        with self._lock:
+            if endpoint == '/sources/' and method == 'GET':
+                return []
+            if endpoint == '/sources/':
+                self.sources_created.append(data['title'])
+                n = len(self.sources_created)
+                return [{'new': {'gramps_id': f'S{n}', 'handle': f'source{n}'}}]
+            if endpoint == '/citations/':
+                return {'gramps_id': f"C-{data['page']}", 'handle': f"citation-{data['page']}"}
+            if endpoint == '/people/person1' and method == 'GET':
+                return {'handle': 'person1', 'citation_list': []}
+            if endpoint == '/people/person1':
+                self.person_updates.append(data['citation_list'])
+                return {}
+        raise Exception(f"Unexpected request: {method} {endpoint}")
+
+    def create_citation(self, source_handle, page=None, confidence=2, note=None):
+        if page in self.failing_urls:
+            raise ConnectionError("Gramps Web went away")
+        return super().create_citation(source_handle, page=page, confidence=confidence, note=note)
+
+
+def create_cluster(db_session, urls):
+    cluster = PersonCluster(canonical_name="Patricia Blundon", name_variants='["Patricia Blundon"]')
+    db_session.add(cluster)
+    for url in urls:
+        obit = ObituaryCache(url=url, url_hash=hash_url(url), extracted_text="text")
+        db_session.add(obit)
+        db_session.flush()
+        db_session.add(ExtractedFact(
+            obituary_cache_id=obit.id,
+            fact_type='person_name',
+            subject_name="Patricia Blundon",
+            subject_role='deceased_primary',
+            fact_value="Patricia Blundon",
+            confidence_score=0.9,
+            person_cluster_id=cluster.id
+        ))
+    db_session.commit()
+    return cluster.id
+
+
+def test_link_records_citations_that_succeeded_when_one_fails(db_session):
+    urls = [f"http://test.com/obit{i}" for i in range(5)]
+    cluster_id = create_cluster(db_session, urls)
+    gramps = FakeGrampsClient(failing_urls={urls[2]})
+
+    result = CitationService(db_session, gramps).link_cluster_to_gramps(
+        cluster_id, 'I0001', 'person1'
+    )
+
+    assert result['success']
+    assert result['citations_created'] == 4
+
+    # One source per obituary, each created once
+    assert len(gramps.sources_created) == 5
+
+    # Every citation made in Gramps is recorded locally and on the person
+    recorded = db_session.query(GrampsCitation).order_by(GrampsCitation.obituary_cache_id).all()
+    assert [c.gramps_citation_id for c in recorded] == [f"C-{url}" for url in urls if url != urls[2]]
+    assert gramps.person_updates == [[f"citation-{url}" for url in urls if url != urls[2]]]
+
+    # A retry only creates the missing citation
+    gramps.failing_urls.clear()
+    retry = CitationService(db_session, gramps).link_cluster_to_gramps(
+        cluster_id, 'I0001', 'person1'
+    )
+
+    assert retry['citations_created'] == 1
+    assert retry['citations_skipped'] == 4
+    assert db_session.query(GrampsCitation).count() == 5
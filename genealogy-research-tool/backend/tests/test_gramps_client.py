@@ -0,0 +1,90 @@
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.gramps_client import GrampsClient, _char_mask
+
+
+PEOPLE = [
+    ("Patricia", "Blundon"),
+    ("Steven", "Blundon"),
+    ("Ryan", "Blundon"),
+    ("Amy", "Blundon"),
+    ("Rose Mary", "Kaczmarowski"),
+    ("Terrence", "Kaczmarowski"),
+    ("Maxine", "Kaczmarowski"),
+    ("Megan", "Wurz"),
+    ("Ross", "Wurz"),
+    ("Donna", "Paradowski"),
+    ("Reginald", "Paradowski"),
+    ("Nobody", None),
+]
+
+
+class FakeGrampsClient(GrampsClient):
+    """GrampsClient whose people list comes from PEOPLE instead of the API"""
+
+    def __init__(self):
+        super().__init__(base_url='http://gramps.test', api_token='test')
+        self.people_requests = 0
+
+    def _request(self, method, endpoint, **kwargs):
+        assert (method, endpoint) == ('GET', '/people/')
+        self.people_requests += 1
+        return {'data': [
+            {
+                'handle': f'h{i}',
+                'primary_name': {
+                    'first_name': given,
+                    'surname_list': [{'surname': surname}] if surname else []
+                }
+            }
+            for i, (given, surname) in enumerate(PEOPLE)
+        ]}
+
+
+def test_search_people_by_names_matches_search_people():
+    client = FakeGrampsClient()
+    names = [
+        ("Patricia", "Blundon"),
+        ("patricia", "BLUNDON"),     # filters ignore case
+        (None, "Blundon"),
+        ("ROSE", "kaczmarowski"),
+        ("r", None),                 # given name only
+        ("Ma", "Kacz"),              # substrings match like search_people
+        ("Ross", "Wurz"),
+        ("Amy", "Quinn"),            # surname rejected by the character mask
+        ("Zelda", "Blundon"),        # no match
+        (None, None),
+    ]
+
+    for limit in (1, 2, 10):
+        batched = client.search_people_by_names(names, limit=limit)
+        assert batched == [
+            client.search_people(given_name=given, surname=surname, limit=limit)
+            for given, surname in names
+        ]
+
+    # The people list is fetched once per client
+    assert client.people_requests == 1
+
+
+def test_surname_mask_rejects_unseen_characters():
+    client = FakeGrampsClient()
+    client._load_people()
+
+    assert _char_mask("quinn") & ~client._surnames_mask
+    assert not _char_mask("blundon") & ~client._surnames_mask
+    assert client.search_people_by_names([("Amy", "Quinn")]) == [[]]
+
+
+def test_client_reuses_its_workers_until_closed():
+    with FakeGrampsClient() as client:
+        assert client.map_concurrently(lambda n: n * n, range(20)) == [n * n for n in range(20)]
+        assert client.map_concurrently(str, [3, 1, 2]) == ['3', '1', '2']
+        workers = set(client._executor._threads)
+
+    assert workers and client._executor._shutdown
+    assert not any(worker.is_alive() for worker in workers)
@@ -0,0 +1,118 @@
+import pytest
+import sys
+import json
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from models import Base, ObituaryCache, LLMCache, ExtractedFact
+import services.llm_extractor as llm_extractor
+from services.llm_extractor import (
+    extract_facts_from_obituary,
+    extract_person_mentions,
+    FACT_EXTRACTION_PROMPT
+)
+from utils.hash_utils import hash_url, hash_prompt
+
+
+@pytest.fixture
+def db_session():
+    """Create test database session"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def test_validate_name_collapses_whitespace():
+    fact = ExtractedFact(subject_name="  Patricia   L.  Blundon ", related_name="Ryan\tBlundon")
+
+    assert fact.subject_name == "Patricia L. Blundon"
+    assert fact.related_name == "Ryan Blundon"
+
+
+@pytest.mark.asyncio
+async def test_facts_differing_only_in_spacing_are_deduplicated(db_session):
+    """Names are normalized before the dedup key is built"""
+    obit_text = "Patricia Blundon, mother of Ryan Blundon."
+    person_mentions = [
+        {"full_name": "Patricia Blundon", "role": "deceased"},
+        {"full_name": "Ryan Blundon", "role": "child"},
+    ]
+    facts_data = [
+        {"fact_type": "person_name", "subject_name": "Patricia Blundon"},
+        {"fact_type": "person_name", "subject_name": "Patricia  Blundon "},
+        {"fact_type": "relationship", "subject_name": "Patricia Blundon",
+         "related_name": "Ryan Blundon", "relationship_type": "child"},
+        {"fact_type": "relationship", "subject_name": " Patricia Blundon",
+         "related_name": "Ryan   Blundon", "relationship_type": "child"},
+    ]
+
+    obit = ObituaryCache(
+        url="http://test.com/patricia",
+        url_hash=hash_url("http://test.com/patricia"),
+        extracted_text=obit_text
+    )
+    db_session.add(obit)
+    db_session.commit()
+
+    # Seed the LLM cache so no API call is made
+    person_list = "\n".join(f"- {p['full_name']} ({p['role']})" for p in person_mentions)
+    prompt = FACT_EXTRACTION_PROMPT.format(person_list=person_list, obituary_text=obit_text)
+    db_session.add(LLMCache(
+        obituary_cache_id=obit.id,
+        llm_provider="openai",
+        model_version="gpt-3.5-turbo",
+        prompt_hash=hash_prompt(prompt),
+        prompt_text=prompt,
+        parsed_json=json.dumps(facts_data)
+    ))
+    db_session.commit()
+
+    facts = await extract_facts_from_obituary(db_session, obit.id, obit_text, person_mentions)
+
+    assert len(facts) == 2
+    assert db_session.query(ExtractedFact).count() == 2
+    assert facts[0].fact_value == "Patricia Blundon"
+    assert facts[1].related_name == "Ryan Blundon"
+
+
+class FailingOpenAI:
+    """AsyncOpenAI stand-in whose requests always fail"""
+
+    def __init__(self):
+        self.chat = self
+        self.completions = self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def create(self, **kwargs):
+        raise RuntimeError("API unavailable")
+
+
+@pytest.mark.asyncio
+async def test_failed_call_is_left_uncommitted_without_commit(db_session, monkeypatch):
+    """With commit=False the error row is left for the caller to keep or roll back"""
+    monkeypatch.setattr(llm_extractor.openai, 'AsyncOpenAI', FailingOpenAI)
+    obit = ObituaryCache(
+        url="http://test.com/failed",
+        url_hash=hash_url("http://test.com/failed"),
+        extracted_text="Patricia Blundon"
+    )
+    db_session.add(obit)
+    db_session.commit()
+
+    with pytest.raises(RuntimeError):
+        await extract_person_mentions(db_session, obit.id, obit.extracted_text, commit=False)
+
+    db_session.rollback()
+    assert db_session.query(LLMCache).count() == 0
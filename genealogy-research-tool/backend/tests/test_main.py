@@ -0,0 +1,69 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+import main
+from models import Base, ObituaryCache, LLMCache, ExtractedFact
+
+
+@pytest.fixture
+def db_session():
+    """Create test database session"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_extraction_keeps_llm_calls_but_not_partial_facts(db_session, monkeypatch):
+    async def failing_extraction(db, obituary_cache_id, obituary_text, commit=True):
+        # Pass 1 succeeded and a fact was flushed before pass 2 failed
+        db.add(LLMCache(
+            obituary_cache_id=obituary_cache_id,
+            model_version="gpt-3.5-turbo",
+            prompt_hash="pass1",
+            prompt_text="prompt",
+            parsed_json="[]"
+        ))
+        db.add(ExtractedFact(
+            obituary_cache_id=obituary_cache_id,
+            fact_type='person_name',
+            subject_name="Patricia Blundon",
+            fact_value="Patricia Blundon",
+            confidence_score=0.9
+        ))
+        db.flush()
+        db.add(LLMCache(
+            obituary_cache_id=obituary_cache_id,
+            model_version="gpt-3.5-turbo",
+            prompt_hash="pass2",
+            prompt_text="prompt",
+            api_error="API unavailable"
+        ))
+        raise RuntimeError("API unavailable")
+
+    monkeypatch.setattr(main, 'process_obituary_full', failing_extraction)
+    request = main.ProcessObituaryRequest(
+        source_url="http://test.com/patricia",
+        obituary_text="Patricia Blundon"
+    )
+
+    with pytest.raises(HTTPException):
+        await main.process_obituary(request, db_session)
+
+    db_session.expire_all()
+    obituary = db_session.query(ObituaryCache).one()
+    assert obituary.processing_status == 'failed'
+    assert db_session.query(ExtractedFact).count() == 0
+    assert sorted(
+        (call.prompt_hash, call.api_error) for call in db_session.query(LLMCache)
+    ) == [("pass1", None), ("pass2", "API unavailable")]
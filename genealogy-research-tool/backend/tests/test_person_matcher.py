@@ -0,0 +1,122 @@
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.person_matcher import PersonMatcher
+
+
+NAMES = [
+    "Patricia L. Blundon",
+    "Patsy Blundon",
+    "Steven Blundon",
+    "Ryan Blundon",
+    "Rose Mary Kaczmarowski",
+    "Rosemary Kaczmarowski",
+    "Terrence E. Kaczmarowski",
+    "Megan Wurz",
+    "Ross Wurz",
+    "Amy",
+]
+
+
+def test_exact_normalized_match():
+    matcher = PersonMatcher()
+    result = matcher.match_score("Patricia L. Blundon", "patricia  blundon")
+
+    assert result['method'] == 'exact_normalized'
+    assert result['confidence'] == 1.0
+
+
+def test_normalize_name_strips_initials_and_suffixes():
+    matcher = PersonMatcher()
+
+    assert matcher.normalize_name("Terrence E. Kaczmarowski III") == "terrence kaczmarowski"
+    assert matcher.normalize_name("Steven Blundon jr.") == "steven blundon"
+    assert matcher.normalize_name("Ross  Wurz") == "ross wurz"
+
+
+def test_known_nickname_match():
+    matcher = PersonMatcher()
+    result = matcher.match_score("Patricia Blundon", "Patsy Blundon")
+
+    assert result['method'] == 'known_nickname'
+
+
+def test_different_surname_rejected():
+    matcher = PersonMatcher()
+    result = matcher.match_score("Megan Wurz", "Megan Blundon")
+
+    assert result['method'] == 'different_surname'
+    assert result['confidence'] == 0.0
+
+
+def test_short_first_name_does_not_match_inside_longer_one():
+    """Partial ratio stays anchored on matching blocks (Amy != Kathy)"""
+    matcher = PersonMatcher()
+    result = matcher.match_score("Amy Blundon", "Kathy Blundon")
+
+    assert result['details']['partial'] < 90
+    assert result['confidence'] == 0.0
+
+
+def test_find_potential_matches_agrees_with_match_score():
+    """Batch scoring must produce the same results as pairwise scoring"""
+    matcher = PersonMatcher()
+
+    for target in NAMES:
+        batch = matcher.find_potential_matches(target, NAMES, min_confidence=0.0)
+        expected = [
+            (candidate, matcher.match_score(target, candidate))
+            for candidate in NAMES
+            if candidate != target
+        ]
+        expected.sort(key=lambda x: x[1]['score'], reverse=True)
+
+        assert batch == expected
+
+
+def test_find_potential_matches_threshold():
+    matcher = PersonMatcher()
+    matches = matcher.find_potential_matches("Rose Mary Kaczmarowski", NAMES)
+
+    matched_names = [name for name, _ in matches]
+    assert "Rosemary Kaczmarowski" in matched_names
+    assert "Megan Wurz" not in matched_names
+
+
+def test_match_scores_matches_pairwise():
+    matcher = PersonMatcher()
+    results = matcher.match_scores("Patricia Blundon", NAMES)
+
+    assert results == [matcher.match_score("Patricia Blundon", n) for n in NAMES]
+
+
+def test_match_score_matrix_matches_per_target():
+    matcher = PersonMatcher()
+    targets = ["Patricia Blundon", "Patsy Blundon", "Amy Wurz"]
+    matrix = matcher.match_score_matrix(targets, NAMES, score_cutoff=85)
+
+    assert matrix == [matcher.match_scores(t, NAMES, score_cutoff=85) for t in targets]
+
+
+def test_surname_blocking_keeps_all_possible_matches():
+    """Any pair not rejected for surname must share a blocking key"""
+    matcher = PersonMatcher()
+    names = NAMES + ["Ryan Blundin", "Amy Wurtz", "Steven Blundon Jr."]
+
+    for target in names:
+        probe = matcher.surname_probe_keys(target)
+        for candidate in names:
+            result = matcher.match_score(target, candidate)
+            if result['method'] == 'different_surname' or probe is None:
+                continue
+            assert set(probe) & set(matcher.surname_block_keys(candidate)), (target, candidate)
+
+
+def test_name_parts_shared_across_matchers():
+    parts = PersonMatcher().name_parts("Steven L. Blundon Jr.")
+
+    assert PersonMatcher().name_parts("Steven L. Blundon Jr.") is parts
+    assert parts.normalized == "steven blundon"
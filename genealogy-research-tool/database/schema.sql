@@ -16,7 +16,7 @@ CREATE TABLE obituary_cache (
     fetch_error TEXT,
     processing_status ENUM('pending', 'processing', 'completed', 'failed') DEFAULT 'pending',
 
-    INDEX idx_url_hash (url_hash),
+    UNIQUE INDEX idx_url_hash (url_hash),
     INDEX idx_processing_status (processing_status)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
@@ -121,7 +121,10 @@ CREATE TABLE extracted_facts (
     INDEX idx_confidence (confidence_score),
     INDEX idx_resolution (resolution_status),
     INDEX idx_cluster (person_cluster_id),
-    INDEX idx_gramps (gramps_person_id)
+    INDEX idx_gramps (gramps_person_id),
+    INDEX idx_subject_obituary (subject_name, obituary_cache_id),
+    INDEX idx_obituary_role_type (obituary_cache_id, subject_role, fact_type),
+    INDEX idx_cluster_fact_type (person_cluster_id, fact_type)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Person clusters: Same person across multiple obituaries